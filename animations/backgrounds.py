@@ -0,0 +1,42 @@
+# animations/backgrounds.py
+from animations.title_space import TitleBackground
+from animations.game_hex_bg import GameHexBackground
+
+
+class BackgroundService:
+    """
+    씬끼리 배경 객체를 공유하는 서비스 (App.backgrounds).
+    - 씬이 바뀌어도 같은 배경 인스턴스를 넘겨주므로
+      별 깜빡임 / 떠다니는 육각형 상태가 이어지고, 그라디언트도 다시 만들지 않는다.
+    - 크기가 달라졌을 때만 resize 한다.
+    """
+
+    def __init__(self):
+        self._title = None
+        self._game_hex = None
+
+    def title(self, size):
+        """타이틀 / 레벨 선택 화면용 우주 배경."""
+        size = tuple(size)
+        if self._title is None:
+            self._title = TitleBackground(size)
+        else:
+            self._title.resize(size)
+        return self._title
+
+    def on_resolution_changed(self, size):
+        """App.bus 구독: 이미 만들어진 배경만 새 크기로 맞춘다."""
+        size = tuple(size)
+        if self._title is not None:
+            self._title.resize(size)
+        if self._game_hex is not None and self._game_hex.size != size:
+            self._game_hex.resize(size)
+
+    def game_hex(self, size):
+        """인게임 육각형 배경."""
+        size = tuple(size)
+        if self._game_hex is None:
+            self._game_hex = GameHexBackground(size)
+        elif self._game_hex.size != size:
+            self._game_hex.resize(size)
+        return self._game_hex
@@ -2,7 +2,10 @@
 import random
 import pygame
 from core.hexmath import hex_corners
+from core import surfaces
 
+# 육각형 전체 밝기 배율 (스프라이트를 만들 때 적용)
+FADE = 0.18
 
 class GameHexBackground:
     """
@@ -43,6 +46,8 @@ class GameHexBackground:
         base_alpha = random.randint(35, 60)
         alpha = max(10, min(80, base_alpha))
 
+        box_r, sprite = self._make_sprite(radius, alpha)
+
         return {
             "x": x,
             "y": y,
@@ -50,8 +55,31 @@ class GameHexBackground:
             "speed": speed,
             "drift": drift,
             "alpha": alpha,
+            "box_r": box_r,
+            "sprite": sprite,
         }
 
+    @staticmethod
+    def _make_sprite(r, alpha):
+        """
+        스폰할 때 한 번만 육각형 스프라이트를 그려 둔다.
+        다시 스폰될 때까지 draw에서는 blit만 한다.
+        """
+        # 육각형을 담을 박스 크기 (조금 여유)
+        box_r = int(r) + 3
+        box_size = box_r * 2
+
+        # 이 육각형만을 위한 작은 투명 서피스 (박스 중앙 기준 로컬 좌표)
+        hex_surf = surfaces.new_surface((box_size, box_size))
+        local_poly = hex_corners((box_r, box_r), r)
+
+        # 전체 밝기(투명도)를 더 낮추고 싶으면 FADE 조절
+        draw_alpha = max(0, min(255, int(alpha * FADE)))
+
+        fill_color = (255, 255, 255, draw_alpha)
+        pygame.draw.polygon(hex_surf, fill_color, local_poly, 0)
+        return box_r, hex_surf
+
     def _init_hexes(self):
         self.hexes = [self._spawn_hex() for _ in range(self.num_hex)]
 
@@ -85,36 +113,10 @@ class GameHexBackground:
         # 1) 배경
         surface.fill((4, 6, 12))
 
-        # 2) 각 육각형을 '작은 SRCALPHA 서피스'에 그린 뒤,
-        #    메인 surface에 하나씩 blit → 겹치는 부분이 실제로 더 밝아짐
-        for hx in self.hexes:
-            cx, cy = hx["x"], hx["y"]
-            r = hx["r"]
-            alpha = hx["alpha"]
-
-            # 이 육각형의 꼭짓점 (월드 좌표)
-            world_poly = hex_corners((cx, cy), r)
-
-            # 육각형을 담을 박스 크기 (조금 여유)
-            box_r = int(r) + 3
-            box_size = box_r * 2
-
-            # 이 육각형만을 위한 작은 투명 서피스
-            hex_surf = pygame.Surface((box_size, box_size), pygame.SRCALPHA)
-
-            # 월드 좌표 → 로컬 좌표로 옮기기 (박스 중앙 기준)
-            local_poly = []
-            for x, y in world_poly:
-                lx = x - cx + box_r
-                ly = y - cy + box_r
-                local_poly.append((lx, ly))
-
-            # 전체 밝기(투명도)를 더 낮추고 싶으면 FADE 조절
-            FADE = 0.18
-            draw_alpha = max(0, min(255, int(alpha * FADE)))
-
-            fill_color = (255, 255, 255, draw_alpha)
-            pygame.draw.polygon(hex_surf, fill_color, local_poly, 0)
-
-            # 메인 surface에 알파 블렌딩으로 합치기
-            surface.blit(hex_surf, (cx - box_r, cy - box_r))
\ No newline at end of file
+        # 2) 스폰 때 미리 그려 둔 육각형 스프라이트를 메인 surface에 하나씩 blit
+        #    → 겹치는 부분이 실제로 더 밝아짐
+        surface.blits(
+            [(hx["sprite"], (hx["x"] - hx["box_r"], hx["y"] - hx["box_r"]))
+             for hx in self.hexes],
+            doreturn=False,
+        )
@@ -1,12 +1,27 @@
 # animations/scene_transition.py
-import pygame
+from core import surfaces
 
 class SceneFadeTransition:
     """
     씬 전환용 페이드 인/아웃 애니메이션.
     - fade_out: 이전 화면을 어둡게 덮어가며 사라짐
     - fade_in : 새 화면 위에서 어둠이 걷히며 나타남
+
+    캡처 버퍼와 검은 오버레이는 화면 크기별로 한 장씩만 만들어서
+    모든 전환이 같이 쓴다 (전환은 한 번에 하나만 존재).
+    오버레이는 per-surface 알파만 바꿔서 blit 하므로 프레임마다 할당 / fill 없음.
     """
+
+    _capture = None   # 직전에 화면에 나간 프레임 복사본
+    _black = None     # 불투명 검은 Surface (set_alpha로 농도 조절)
+
+    @classmethod
+    def _ensure_buffers(cls, size):
+        if cls._capture is None or cls._capture.get_size() != size:
+            cls._capture = surfaces.new_surface(size, alpha=False)
+            cls._black = surfaces.new_surface(size, alpha=False)
+            cls._black.fill((0, 0, 0))
+
     def __init__(self, app, to_scene, fade_out=0.25, fade_in=0.25):
         self.app = app
         self.to_scene = to_scene
@@ -21,12 +36,20 @@ class SceneFadeTransition:
         self.switched = False     # 실제 씬 교체 완료 여부
 
     def capture_from(self, from_scene):
-        """현재 씬을 한 프레임 그려서 Surface로 캡처."""
-        size = self.app.screen.get_size()
-        surf = pygame.Surface(size).convert_alpha()
-        # 배경 + UI 전부 한 번 그리기
-        from_scene.draw(surf)
-        self.from_surface = surf
+        """
+        이전 화면 캡처.
+        change_scene은 이벤트 처리 중에 불리므로, 이 시점의 app.screen에는
+        직전에 flip된 프레임이 그대로 남아 있다 → 씬을 다시 그리지 않고 복사만 한다.
+        """
+        screen = self.app.screen
+        self._ensure_buffers(screen.get_size())
+        self._capture.blit(screen, (0, 0))
+        self.from_surface = self._capture
+
+    def _blit_black(self, screen, alpha):
+        self._ensure_buffers(screen.get_size())
+        self._black.set_alpha(alpha)
+        screen.blit(self._black, (0, 0))
 
     def update(self, dt):
         self.time += dt
@@ -53,9 +76,7 @@ class SceneFadeTransition:
             t = max(0.0, min(1.0, self.time / max(self.fade_out, 1e-6)))
             alpha = int(255 * t)
 
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, alpha))
-            screen.blit(overlay, (0, 0))
+            self._blit_black(screen, alpha)
 
         elif self.phase == "fade_in":
             # 새 씬을 먼저 그린 다음, 남은 어둠을 걷어내는 느낌
@@ -65,6 +86,4 @@ class SceneFadeTransition:
             alpha = int(255 * (1.0 - t))   # 점점 밝아짐
 
             if alpha > 0:
-                overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, alpha))
-                screen.blit(overlay, (0, 0))
\ No newline at end of file
+                self._blit_black(screen, alpha)
\ No newline at end of file
@@ -1,6 +1,55 @@
 # animations/stage_star_glow.py
 import math
 import pygame
+from core import surfaces
+
+# 0~1 사이로 진동하는 펄스 속도
+SPEED = 0.7  # 1.0 = 기본, 작게 하면 느려짐, 크게 하면 빨라짐
+
+# 한 주기(1 / SPEED 초)를 몇 장의 스프라이트로 나눌지
+GLOW_FRAMES = 48
+
+# (로컬 폴리곤, 색) → 프레임 스프라이트 리스트. 모든 별 3개 타일이 공유한다.
+_frame_cache = surfaces.BoundedCache(8)
+
+
+def _build_frames(local_poly, base_color):
+    """
+    한 주기의 펄스를 GLOW_FRAMES장의 작은 SRCALPHA 스프라이트로 미리 그린다.
+    스프라이트 중심 = 타일 중심.
+    """
+    max_scale = 1.03 + 0.05
+    r = max(math.hypot(x, y) for (x, y) in local_poly)
+    half = int(math.ceil(r * max_scale)) + 3
+    size = half * 2
+
+    frames = []
+    for i in range(GLOW_FRAMES):
+        # i번째 프레임의 위상 (원래 식과 동일: sin(2π · t · SPEED))
+        phase = (math.sin(2.0 * math.pi * i / GLOW_FRAMES) + 1.0) * 0.5
+        alpha = int(60 + 80 * phase)    # 밝기
+        scale = 1.03 + 0.05 * phase     # 살짝 커졌다 작아지는 크기
+
+        scaled = [(half + x * scale, half + y * scale) for (x, y) in local_poly]
+
+        sprite = surfaces.new_surface((size, size))
+        # 테두리만 그려서 기존 타일을 가리지 않게
+        pygame.draw.polygon(sprite, (*base_color, alpha), scaled, width=3)
+        frames.append(sprite)
+    return frames, half
+
+
+def _get_frames(center, poly, base_color):
+    cx, cy = center
+    # 같은 크기의 타일은 위치와 상관없이 같은 key가 되도록 로컬 좌표를 반올림
+    local_poly = tuple((round(x - cx, 1), round(y - cy, 1)) for (x, y) in poly)
+    key = (local_poly, tuple(base_color))
+    entry = _frame_cache.get(key)
+    if entry is None:
+        entry = _build_frames(local_poly, base_color)
+        _frame_cache[key] = entry
+    return entry
+
 
 def draw_stage_star_glow(surface, center, poly, t, base_color=(255, 230, 160)):
     """
@@ -11,27 +60,12 @@ def draw_stage_star_glow(surface, center, poly, t, base_color=(255, 230, 160)):
     - center : (cx, cy) 타일 중심 좌표
     - poly   : 육각형 꼭짓점 리스트
     - t      : 누적 시간(초)
-    """
-    cx, cy = center
 
-    # 0~1 사이로 진동하는 펄스 값
-    SPEED = 0.7  # 1.0 = 기본, 작게 하면 느려짐, 크게 하면 빨라짐
-    phase = (math.sin(t * SPEED * 2.0 * math.pi) + 1.0) * 0.5
-    alpha = int(60 + 80 * phase)    # 밝기
-    scale = 1.03 + 0.05 * phase     # 살짝 커졌다 작아지는 크기
-
-    # 육각형을 중심 기준으로 scale 배만큼 키운다
-    scaled = []
-    for (x, y) in poly:
-        sx = cx + (x - cx) * scale
-        sy = cy + (y - cy) * scale
-        scaled.append((sx, sy))
-
-    w, h = surface.get_size()
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-
-    color = (*base_color, alpha)
-    # 테두리만 그려서 기존 타일을 가리지 않게
-    pygame.draw.polygon(overlay, color, scaled, width=3)
+    펄스는 미리 구워 둔 스프라이트 시퀀스에서 시간(t)을 양자화한 프레임 하나를
+    골라 blit만 한다 → 타일당 blit 1번.
+    """
+    frames, half = _get_frames(center, poly, base_color)
 
-    surface.blit(overlay, (0, 0))
\ No newline at end of file
+    idx = int((t * SPEED % 1.0) * GLOW_FRAMES) % GLOW_FRAMES
+    cx, cy = center
+    surface.blit(frames[idx], (int(round(cx)) - half, int(round(cy)) - half))
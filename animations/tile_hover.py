@@ -3,6 +3,35 @@ import pygame
 import math
 
 from core.hexmath import axial_to_pixel, hex_corners
+from core import surfaces
+
+# hover 밝기 단계 수 (fade_in 동안 이 정도 단계로 나눠 그려도 눈으로는 구분 안 됨)
+HOVER_ALPHA_STEPS = 16
+
+# hex_size → (흰 육각형 스프라이트, 타일 중심 기준 오프셋)
+# 밝기는 blit 직전에 set_alpha로 주므로 크기당 한 장. 카메라 줌 단계(정수 크기 20개 남짓)가
+# 전부 들어가는 크기로 두고, 최근에 쓴 크기를 뒤로 보내는 LRU로 관리한다.
+_hover_sprites = surfaces.BoundedCache(24)
+
+
+def _hover_sprite(hex_size):
+    entry = _hover_sprites.get(hex_size)
+    if entry is None:
+        # 타일 중심을 (0, 0)에 두고 만든 로컬 육각형
+        corners = hex_corners((0.0, 0.0), hex_size - 2)
+        min_x = int(math.floor(min(x for x, y in corners))) - 2
+        max_x = int(math.ceil(max(x for x, y in corners))) + 2
+        min_y = int(math.floor(min(y for x, y in corners))) - 2
+        max_y = int(math.ceil(max(y for x, y in corners))) + 2
+
+        local_corners = [(x - min_x, y - min_y) for (x, y) in corners]
+        overlay = surfaces.new_surface((max_x - min_x, max_y - min_y))
+        pygame.draw.polygon(overlay, (255, 255, 255, 255), local_corners)
+
+        entry = (overlay, (min_x, min_y))
+        _hover_sprites[hex_size] = entry
+    return entry
+
 
 
 class TileHoverAnim:
@@ -43,33 +72,23 @@ def draw_hover_anim(surface: pygame.Surface,
     """
     현재 hover 중인 타일 위에 반투명 흰 육각형을 덮어서
     '밝기가 살짝 올라간' 느낌을 만든다.
+    hex_size / 밝기 단계별로 미리 구운 스프라이트를 blit만 한다.
     """
+    if hex_size <= 2:
+        return
+
     cx, cy = board_center
 
     tx, ty = axial_to_pixel(anim.q, anim.r, hex_size)
     tx += cx
     ty += cy
 
-    corners = hex_corners((tx, ty), hex_size - 2)
-
-    min_x = int(min(x for x, y in corners)) - 2
-    max_x = int(max(x for x, y in corners)) + 2
-    min_y = int(min(y for x, y in corners)) - 2
-    max_y = int(max(y for x, y in corners)) + 2
-
-    w = max_x - min_x
-    h = max_y - min_y
-    if w <= 0 or h <= 0:
-        return
-
-    local_corners = [(x - min_x, y - min_y) for (x, y) in corners]
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-
-    # 진행도에 따라 알파가 서서히 0 → max_alpha로
-    p = anim.progress
+    # 진행도에 따라 알파가 서서히 0 → max_alpha로 (HOVER_ALPHA_STEPS 단계)
+    p = round(anim.progress * HOVER_ALPHA_STEPS) / HOVER_ALPHA_STEPS
     alpha = max(0, min(255, int(anim.max_alpha * p)))
-    color = (255, 255, 255, alpha)
-
-    pygame.draw.polygon(overlay, color, local_corners)
+    if alpha <= 0:
+        return
 
-    surface.blit(overlay, (min_x, min_y))
\ No newline at end of file
+    overlay, (ox, oy) = _hover_sprite(hex_size)
+    overlay.set_alpha(alpha)
+    surface.blit(overlay, (int(round(tx)) + ox, int(round(ty)) + oy))
@@ -3,12 +3,41 @@ import math
 import pygame
 
 from core.hexmath import axial_to_pixel, hex_corners
+from core import surfaces
 from settings import COL_MINE
 
 
 # 흔들림 기본 주파수(크게 할수록 더 떨림이 촘촘해짐)
 SHAKE_FREQ = 28.0  # rad/sec 정도 느낌
 
+# hex_size → (붉은 테두리 스프라이트, 타일 중심 기준 오프셋)
+# 카메라 줌 단계(정수 크기 20개 남짓)가 전부 들어가는 크기, 최근에 쓴 크기를 뒤로 보내는 LRU
+_shake_sprites = surfaces.BoundedCache(24)
+
+
+def _shake_sprite(hex_size):
+    entry = _shake_sprites.get(hex_size)
+    if entry is None:
+        corners = hex_corners((0.0, 0.0), hex_size - 1)
+        min_x = int(math.floor(min(x for x, y in corners))) - 3
+        max_x = int(math.ceil(max(x for x, y in corners))) + 3
+        min_y = int(math.floor(min(y for x, y in corners))) - 3
+        max_y = int(math.ceil(max(y for x, y in corners))) + 3
+
+        local_corners = [(x - min_x, y - min_y) for (x, y) in corners]
+        overlay = surfaces.new_surface((max_x - min_x, max_y - min_y))
+
+        # COL_MINE은 RGB만 들어 있으니까 알파 추가
+        r, g, b = COL_MINE
+        border_color = (r, g, b, 230)
+
+        # 살짝 두꺼운 붉은 테두리만 그려서 "타일이 떨리는 느낌" 내기
+        pygame.draw.polygon(overlay, border_color, local_corners, width=3)
+
+        entry = (overlay, (min_x, min_y))
+        _shake_sprites[hex_size] = entry
+    return entry
+
 
 class TileShakeAnim:
     """
@@ -67,31 +96,11 @@ def _draw_single_shake(surface: pygame.Surface,
         dx = math.sin(phase) * amp
         dy = math.sin(phase * 1.7) * amp * 0.4
 
-        jitter_center = (tx + dx, ty + dy)
-        corners = hex_corners(jitter_center, hex_size - 1)
-
-        min_x = int(min(x for x, y in corners)) - 3
-        max_x = int(max(x for x, y in corners)) + 3
-        min_y = int(min(y for x, y in corners)) - 3
-        max_y = int(max(y for x, y in corners)) + 3
-
-        w = max_x - min_x
-        h = max_y - min_y
-        if w <= 0 or h <= 0:
+        # hex_size별로 한 장 구워 둔 테두리를 흔들린 위치에 blit
+        if hex_size <= 1:
             return
-
-        local_corners = [(x - min_x, y - min_y) for (x, y) in corners]
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-
-        # COL_MINE은 RGB만 들어 있으니까 알파 추가
-        r, g, b = COL_MINE
-        border_color = (r, g, b, 230)
-
-        # 살짝 두꺼운 붉은 테두리만 그려서 "타일이 떨리는 느낌" 내기
-        pygame.draw.polygon(overlay, (0, 0, 0, 0), local_corners)
-        pygame.draw.polygon(overlay, border_color, local_corners, width=3)
-
-        surface.blit(overlay, (min_x, min_y))
+        overlay, (ox, oy) = _shake_sprite(hex_size)
+        surface.blit(overlay, (int(round(tx + dx)) + ox, int(round(ty + dy)) + oy))
 
 
 def draw_shake_anims(surface: pygame.Surface,
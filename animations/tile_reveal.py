@@ -3,6 +3,7 @@ import math
 import pygame
 
 from core.hexmath import axial_to_pixel, hex_corners  # 헥스 좌표 → 픽셀 변환 :contentReference[oaicite:0]{index=0}
+from core import surfaces
 from settings import COL_COVERED                      # 덮인 타일 색상 :contentReference[oaicite:1]{index=1}
 
 
@@ -86,7 +87,7 @@ def _draw_single_reveal(surface: pygame.Surface,
     local_center = (tx - min_x, ty - min_y)
     local_corners = [(x - min_x, y - min_y) for (x, y) in corners]
 
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+    overlay = surfaces.scratch((w, h))
 
     # 1) 전체 육각형을 '덮인 타일' 색으로 채움 (완전히 덮인 상태)
     pygame.draw.polygon(overlay, (*COL_COVERED, 255), local_corners)
@@ -108,7 +109,7 @@ def _draw_single_reveal(surface: pygame.Surface,
         # 1) hole 서피스를 만들고
         # 2) 그 위에 알파 255짜리 원을 그림
         # 3) overlay에 BLEND_RGBA_SUB로 빼서, 해당 영역의 알파를 0으로 만듦
-        hole = pygame.Surface((w, h), pygame.SRCALPHA)
+        hole = surfaces.scratch((w, h))
         pygame.draw.circle(
             hole,
             (0, 0, 0, 255),  # rgba: 알파 255
@@ -3,6 +3,71 @@ import math
 import random
 import pygame
 from core.hexmath import hex_corners
+from core import surfaces
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 순수 파이썬 경로로 계산
+    np = None
+
+
+# 별 스프라이트: 레이어별 반지름 / 알파 단계 수
+STAR_RADII = (1, 1, 2)          # layer 0, 1, 2 (원래 int(radius)와 동일)
+STAR_BASE_ALPHA = (70, 120, 190)
+STAR_COLOR = (230, 238, 255)
+ALPHA_STEPS = 32                # 알파 양자화 단계 (256 / 32 = 8 단위)
+# 별 밀도: 기본 960x720 화면에 160개 → 해상도가 바뀌어도 같은 밀도
+STARS_PER_PIXEL = 160 / (960 * 720)
+
+# 세로 그라디언트 팔레트 (위쪽 색, 아래쪽 색)
+GRADIENT_PALETTE = ((6, 10, 20), (16, 35, 75))
+
+# (크기, 팔레트) → 그라디언트 Surface. 읽기 전용으로만 쓴다.
+_gradient_cache = surfaces.BoundedCache(4)
+
+
+def make_gradient(size, palette=GRADIENT_PALETTE):
+    """
+    세로 그라디언트를 배열 연산 한 번으로 만들고 (크기, 팔레트)별로 캐시한다.
+    numpy가 없으면 1px 세로줄을 만든 뒤 transform.scale로 늘린다.
+    """
+    w, h = size
+    key = (w, h, palette)
+    surf = _gradient_cache.get(key)
+    if surf is not None:
+        return surf
+
+    top, bottom = palette
+    diff = [b - a for a, b in zip(top, bottom)]
+    if np is not None:
+        t = np.arange(h, dtype=np.float64) / max(1, h - 1)
+        col = (np.asarray(top, dtype=np.float64) + np.outer(t, diff)).astype(np.uint8)
+        surf = pygame.surfarray.make_surface(np.broadcast_to(col, (w, h, 3)).copy())
+    else:
+        column = pygame.Surface((1, h))
+        for y in range(h):
+            t = y / max(1, h - 1)
+            column.set_at((0, y), tuple(int(a + d * t) for a, d in zip(top, diff)))
+        surf = pygame.transform.scale(column, (w, h))
+
+    _gradient_cache[key] = surf
+    return surf
+
+
+def _make_star_sprites():
+    """(반지름, 알파 단계)마다 작은 별 스프라이트를 미리 그려 둔다."""
+    sprites = {}
+    step = 256 // ALPHA_STEPS
+    for radius in set(STAR_RADII):
+        size = radius * 2 + 1
+        row = []
+        for level in range(ALPHA_STEPS):
+            alpha = min(255, level * step + step // 2)
+            spr = surfaces.new_surface((size, size))
+            pygame.draw.circle(spr, (*STAR_COLOR, alpha), (radius, radius), radius)
+            row.append(spr)
+        sprites[radius] = row
+    return sprites
 
 
 class TitleBackground:
@@ -12,106 +77,127 @@ class TitleBackground:
     - 제자리에서 깜빡이는 별
     - 중앙 위쪽 헥사곤 링(옵션)
     """
-    def __init__(self, size, num_stars=160, show_hex=True):
+    _star_sprites = None   # 모든 인스턴스가 공유하는 별 스프라이트
+    _star_table = None     # numpy 경로용 평탄화 테이블
+
+    def __init__(self, size, num_stars=None, show_hex=True, palette=GRADIENT_PALETTE):
         self.w, self.h = size
-        self.num_stars = num_stars
+        # None이면 화면 넓이에 비례 (resize 때도 다시 계산)
+        self.fixed_num_stars = num_stars
+        self.num_stars = self._star_count()
         self.show_hex = show_hex
+        self.palette = palette
 
         self.time = 0.0
-        self.stars = []
 
         self._make_gradient()
         self._init_stars()
 
-    # 해상도 바뀔 때 호출
+    # 해상도 바뀔 때 호출 (같은 크기면 별 상태를 그대로 유지)
     def resize(self, size):
+        if (self.w, self.h) == tuple(size):
+            return
         self.w, self.h = size
+        self.num_stars = self._star_count()
         self._make_gradient()
         self._init_stars()   # 화면 크기에 맞게 별 재배치
 
-    # 배경 세로 그라디언트
+    def _star_count(self):
+        if self.fixed_num_stars is not None:
+            return self.fixed_num_stars
+        return max(1, round(self.w * self.h * STARS_PER_PIXEL))
+
+    # 배경 세로 그라디언트 (캐시 공유)
     def _make_gradient(self):
-        self.bg = pygame.Surface((self.w, self.h))
-        for y in range(self.h):
-            t = y / max(1, self.h - 1)
-            r = int(6 + 10 * t)
-            g = int(10 + 25 * t)
-            b = int(20 + 55 * t)
-            pygame.draw.line(self.bg, (r, g, b), (0, y), (self.w, y))
+        self.bg = make_gradient((self.w, self.h), self.palette)
 
     # 별 초기화 (위치는 고정, 밝기만 깜빡이게)
+    # 별 데이터는 dict 리스트 대신 배열(열 단위)로 보관한다.
     def _init_stars(self):
-        self.stars = []
-        for _ in range(self.num_stars):
-            layer = random.choice([0, 1, 2])
-
-            if layer == 0:
-                radius = 1
-                base_alpha = 70
-            elif layer == 1:
-                radius = 1.5
-                base_alpha = 120
-            else:
-                radius = 2
-                base_alpha = 190
-
-            x = random.uniform(0, self.w)
-            y = random.uniform(0, self.h)
-
-            flicker_speed = random.uniform(0.8, 1.6)   # 별마다 다른 깜빡임 속도
-            phase = random.uniform(0, math.tau)        # 시작 위상 다르게
-
-            self.stars.append({
-                "x": x,
-                "y": y,
-                "radius": radius,
-                "base_alpha": base_alpha,
-                "flicker_speed": flicker_speed,
-                "phase": phase,
-            })
+        layers = [random.choice([0, 1, 2]) for _ in range(self.num_stars)]
+        radii = [STAR_RADII[l] for l in layers]
+        base_alpha = [STAR_BASE_ALPHA[l] for l in layers]
+
+        xs = [random.uniform(0, self.w) for _ in range(self.num_stars)]
+        ys = [random.uniform(0, self.h) for _ in range(self.num_stars)]
+
+        # 별마다 다른 깜빡임 속도 / 시작 위상
+        speed2 = [2.0 * random.uniform(0.8, 1.6) for _ in range(self.num_stars)]
+        phase = [random.uniform(0, math.tau) for _ in range(self.num_stars)]
+
+        # blit 좌표 (원 중심 → 스프라이트 좌상단)
+        self.star_pos = [(int(x) - r, int(y) - r) for x, y, r in zip(xs, ys, radii)]
+        self.star_radius = radii
+
+        if TitleBackground._star_sprites is None:
+            TitleBackground._star_sprites = _make_star_sprites()
+            if np is not None:
+                # (반지름, 알파 단계) → 스프라이트를 1차원 테이블로 펼쳐 둠
+                table = np.empty((max(STAR_RADII) + 1) * ALPHA_STEPS, dtype=object)
+                for r, row in TitleBackground._star_sprites.items():
+                    table[r * ALPHA_STEPS:(r + 1) * ALPHA_STEPS] = row
+                TitleBackground._star_table = table
+
+        if np is not None:
+            self.star_key = np.asarray(radii, dtype=np.int32) * ALPHA_STEPS
+            self.star_base_alpha = np.asarray(base_alpha, dtype=np.float32)
+            self.star_speed2 = np.asarray(speed2, dtype=np.float32)
+            self.star_phase = np.asarray(phase, dtype=np.float32)
+        else:
+            self.star_base_alpha = base_alpha
+            self.star_speed2 = speed2
+            self.star_phase = phase
 
     # 프레임별 업데이트 (별 위치는 안 움직이고, 시간만 흐름)
     def update(self, dt):
         self.time += dt
 
-    # 별 그리기
+    def _star_sprite_list(self):
+        """모든 별의 현재 알파를 한 번에 계산해서, 별마다 찍을 스프라이트를 고른다."""
+        step = 256 // ALPHA_STEPS
+        if np is not None:
+            flicker = 0.5 + 0.5 * np.sin(self.time * self.star_speed2 + self.star_phase)
+            alpha = self.star_base_alpha * (0.6 + 0.4 * flicker)
+            alpha = np.clip(alpha.astype(np.int32), 30, 255)
+            return TitleBackground._star_table[self.star_key + alpha // step].tolist()
+
+        sprites = TitleBackground._star_sprites
+        out = []
+        t = self.time
+        for r, base, sp, ph in zip(self.star_radius, self.star_base_alpha,
+                                   self.star_speed2, self.star_phase):
+            flicker = 0.5 + 0.5 * math.sin(t * sp + ph)
+            alpha = max(30, min(255, int(base * (0.6 + 0.4 * flicker))))
+            out.append(sprites[r][alpha // step])
+        return out
+
+    # 별 그리기: 미리 그린 스프라이트를 한 번의 blits 호출로 찍는다
     def _draw_stars(self, surf):
-        star_surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-        for s in self.stars:
-            flicker = 0.5 + 0.5 * math.sin(
-                self.time * 2.0 * s["flicker_speed"] + s["phase"]
-            )
-            alpha = int(s["base_alpha"] * (0.6 + 0.4 * flicker))
-            color = (230, 238, 255, max(30, min(255, alpha)))
-
-            pygame.draw.circle(
-                star_surf,
-                color,
-                (int(s["x"]), int(s["y"])),
-                int(s["radius"])
-            )
-        surf.blit(star_surf, (0, 0))
+        surf.blits(zip(self._star_sprite_list(), self.star_pos), doreturn=False)
 
     # 중앙 헥사곤 장식 링
     def _draw_hex_ring(self, surf):
-        overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
         cx, cy = self.w // 2, int(self.h * 0.32)
 
         base_radius = min(self.w, self.h) * 0.12
         radii = [base_radius * r for r in (0.9, 1.2, 1.5)]
 
+        # 링 전체를 담는 박스 크기의 임시 서피스 (전체 화면 대신)
+        half = int(math.ceil(radii[-1])) + 3
+        overlay = surfaces.scratch((half * 2, half * 2))
+
         for i, r in enumerate(radii):
             pulse = 0.5 + 0.5 * math.sin(self.time * 0.9 + i * 1.4)
             alpha = int(40 + 40 * pulse)
             width = 1 + int(1 * pulse)
             color = (140, 180, 255, alpha)
-            pts = hex_corners((cx, cy), r)
+            pts = hex_corners((half, half), r)
             pygame.draw.polygon(overlay, color, pts, width=width)
 
-        surf.blit(overlay, (0, 0))
+        surf.blit(overlay, (cx - half, cy - half))
 
-    # 최종 그리기
-    def draw(self, surf):
+    # 최종 그리기 (show_hex를 넘기면 이번 프레임만 링 표시 여부를 덮어씀)
+    def draw(self, surf, show_hex=None):
         # 배경 그라디언트
         surf.blit(self.bg, (0, 0))
 
@@ -119,5 +205,7 @@ class TitleBackground:
         self._draw_stars(surf)
 
         # 중앙 헥사곤 장식 (옵션)
-        if self.show_hex:
+        if show_hex is None:
+            show_hex = self.show_hex
+        if show_hex:
             self._draw_hex_ring(surf)
\ No newline at end of file
@@ -2,6 +2,11 @@ import os, sys, pygame
 import json
 import settings
 from core.scenes import TitleScene
+from core.input import FrameInput
+from core import surfaces
+from core import bus
+from core import render as render_mod
+from animations.backgrounds import BackgroundService
 
 class App:
     def __init__(self):
@@ -15,6 +20,9 @@ class App:
 
         self.save_path = os.path.join(self.SAVE_DIR, "save.json")
 
+        # 해상도 / 표시 모드 / 스테이지 / 볼륨 변경 알림 (캐시 무효화용)
+        self.bus = bus.EventBus()
+
         self.max_unlocked_stage = 1
         self.stage_best_stars = {}   # ← 추가: 스테이지별 최고 별 개수
         self.load_progress()
@@ -76,14 +84,39 @@ class App:
         from core import ui as ui_mod
         ui_mod.play_ui_click = self.play_ui_click
 
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        # 논리 해상도 렌더링: 씬은 self.screen(논리 크기)에, 실제 창은 self.display
+        self.logical_render = getattr(settings, "LOGICAL_RENDER", False)
+        self.logical_smooth = getattr(settings, "LOGICAL_SMOOTH_SCALE", False)
+        self._present_key = None
+        self._present_rect = None
+        self._present_dest = None
+        self.screen = None
+        self.screen_size = None
+
+        self.attach_display(pygame.display.set_mode((self.WIDTH, self.HEIGHT)))
         pygame.display.set_caption("HEXFIELD")
         self.clock = pygame.time.Clock()
 
+        # 입력 단계: 프레임마다 MOUSEMOTION 합치기 + 입력 통계
+        self.input = FrameInput()
+        if self.logical_render:
+            self.input.pos_transform = self.to_logical
+            self.input.rel_transform = self.to_logical_rel
+
+        # 씬끼리 공유하는 배경 (별 / 육각형 상태 유지, 재생성 없음)
+        self.backgrounds = BackgroundService()
+
+        # 화면 크기에 묶인 공용 캐시는 씬보다 먼저 갱신되도록 여기서 구독
+        self.bus.subscribe(bus.RESOLUTION_CHANGED, self.backgrounds.on_resolution_changed)
+        self.bus.subscribe(bus.RESOLUTION_CHANGED, render_mod.on_resolution_changed)
+        self.bus.subscribe(bus.STAGE_LOADED, render_mod.on_stage_loaded)
+
         self.current_scene = TitleScene(self)
         self.running = True  # ← 루프 제어 플래그
 
         self.transition = None
+        # 마지막으로 화면 전체를 그린 씬 (damage만 내보내는 씬의 기준 화면)
+        self._drawn_scene = None
 
     def load_font(self, size):
         # assets 폴더에 폰트 파일이 있다면 여기서 불러오기
@@ -144,6 +177,8 @@ class App:
         except OSError as e:
             print("[WARN] 진행도 저장 실패:", e)
 
+        self.bus.publish(bus.PROGRESS_CHANGED, max_unlocked=self.max_unlocked_stage)
+
     def unlock_stage(self, cleared_index: int,
                      total_stages: int = 37,
                      star_count: int | None = None):
@@ -189,12 +224,20 @@ class App:
         - use_transition=True 이면 페이드 아웃/인 애니메이션을 사용
         - False 이면 바로 교체
         """
+        # 나가는 씬의 버스 구독 해제 (전환 중 페이드 아웃은 캡처 화면만 쓴다)
+        if self.current_scene is not None and self.current_scene is not scene_obj:
+            self.current_scene.on_exit()
+
         if not use_transition or self.current_scene is None:
             self.current_scene = scene_obj
             return
 
         # 이미 전환 중이면 그냥 즉시 교체해 버림 (중첩 방지)
         if self.transition is not None:
+            # 아직 들어오지 못한 씬도 버려지므로 같이 정리
+            pending = self.transition.to_scene
+            if not self.transition.switched and pending is not scene_obj:
+                pending.on_exit()
             self.current_scene = scene_obj
             self.transition = None
             return
@@ -207,12 +250,89 @@ class App:
         trans.capture_from(self.current_scene)
         self.transition = trans
 
+    # --- 화면 출력 ---
+    def attach_display(self, display):
+        """
+        set_mode로 얻은 실제 화면을 연결하고 씬이 그릴 self.screen을 정한다.
+        논리 해상도 모드가 아니거나 크기가 같으면 화면에 바로 그린다.
+        """
+        self.display = display
+        self._present_key = None
+        # 새 화면에는 이전 프레임 내용이 없으므로 다음 프레임은 전체를 그린다
+        self._drawn_scene = None
+
+        # set_mode는 같은 Surface 객체를 돌려줄 수 있으므로 크기는 따로 기억해 둔다
+        old_size = self.screen_size
+        size = (self.WIDTH, self.HEIGHT)
+        if not self.logical_render or display.get_size() == size:
+            self.screen = display
+        elif self.screen is None or self.screen is display or self.screen.get_size() != size:
+            self.screen = surfaces.new_surface(size, alpha=False)
+
+        # 씬 좌표계 크기가 실제로 바뀐 경우에만 알림
+        self.screen_size = self.screen.get_size()
+        if old_size is not None and self.screen_size != old_size:
+            self.bus.publish(bus.RESOLUTION_CHANGED, size=self.screen_size)
+
+    def _present_layout(self):
+        """논리 화면이 실제 화면에 들어갈 영역 (비율 유지 + 레터박스). 크기가 바뀔 때만 계산."""
+        key = (self.screen.get_size(), self.display.get_size())
+        if key != self._present_key:
+            (lw, lh), (dw, dh) = key
+            scale = min(dw / lw, dh / lh)
+            tw, th = max(1, int(lw * scale)), max(1, int(lh * scale))
+            rect = pygame.Rect(0, 0, tw, th)
+            rect.center = (dw // 2, dh // 2)
+
+            self.display.fill((0, 0, 0))
+            self._present_rect = rect
+            # 스케일 결과를 화면의 해당 영역에 바로 쓰도록 subsurface를 만들어 둠
+            self._present_dest = self.display.subsurface(rect)
+            self._present_key = key
+        return self._present_rect
+
+    def to_logical(self, pos):
+        """실제 화면 좌표 → 논리 해상도 좌표"""
+        if self.screen is self.display:
+            return pos
+        rect = self._present_layout()
+        lw, lh = self.screen.get_size()
+        x = (pos[0] - rect.x) * lw // rect.width
+        y = (pos[1] - rect.y) * lh // rect.height
+        return (x, y)
+
+    def to_logical_rel(self, rel):
+        """실제 화면에서의 이동량(MOUSEMOTION rel) → 논리 해상도 기준 이동량"""
+        if self.screen is self.display:
+            return rel
+        rect = self._present_layout()
+        lw, lh = self.screen.get_size()
+        return (rel[0] * lw / rect.width, rel[1] * lh / rect.height)
+
+    def present(self, damage=None):
+        """
+        이번 프레임을 화면에 내보낸다 (논리 해상도면 스케일 1번 + flip).
+        damage: 바뀐 영역 rect 목록. 실제 창에 바로 그릴 때는 그 영역만 update 한다.
+                None이면 전체 flip. 논리 해상도 스케일은 항상 전체를 내보낸다.
+        """
+        if self.screen is not self.display:
+            self._present_layout()
+            if self.logical_smooth:
+                pygame.transform.smoothscale(self.screen, self._present_rect.size, self._present_dest)
+            else:
+                pygame.transform.scale(self.screen, self._present_rect.size, self._present_dest)
+        elif damage is not None:
+            if damage:
+                pygame.display.update(damage)
+            return
+        pygame.display.flip()
+
     # 해상도 변경 메서드
     def set_resolution(self, index:int):
         if 0 <= index < len(self.resolutions):
             self.res_index = index
             self.WIDTH, self.HEIGHT = self.resolutions[index]
-            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+            self.attach_display(pygame.display.set_mode((self.WIDTH, self.HEIGHT)))
 
     def set_display_mode(self, index: int):
         """표시 모드 변경: 창 / 큰 창 / 전체 화면."""
@@ -243,12 +363,16 @@ class App:
         else:
             w, h = base_w, base_h
 
-        self.WIDTH, self.HEIGHT = w, h
-        self.screen = pygame.display.set_mode((w, h), flags)
+        if not self.logical_render:
+            self.WIDTH, self.HEIGHT = w, h
+        # 논리 해상도 모드에서는 WIDTH/HEIGHT(씬 좌표계)는 그대로, 실제 화면만 바뀜
+        self.attach_display(pygame.display.set_mode((w, h), flags))
+        self.bus.publish(bus.DISPLAY_MODE_CHANGED, index=index)
 
     # --- 사운드 유틸 ---
     def update_bgm_volume(self):
         pygame.mixer.music.set_volume(self.bgm_volume)
+        self.bus.publish(bus.VOLUME_CHANGED, bgm=self.bgm_volume, sfx=self.sfx_volume)
 
     def update_sfx_volume(self):
         vol = self.sfx_volume
@@ -258,6 +382,7 @@ class App:
                     self.sfx_tile_hover):
             if snd is not None:
                 snd.set_volume(vol)
+        self.bus.publish(bus.VOLUME_CHANGED, bgm=self.bgm_volume, sfx=self.sfx_volume)
 
     def play_bgm(self, key: str):
         """지정한 키의 BGM을 loop 재생 (같은 키면 재로딩 없이 볼륨만)."""
@@ -303,8 +428,8 @@ class App:
         while self.running:
             dt = self.clock.tick(self.FPS) / 1000.0
 
-            # --- 이벤트 처리 ---
-            for e in pygame.event.get():
+            # --- 이벤트 처리 (모션은 프레임마다 합쳐서 전달) ---
+            for e in self.input.collect():
                 if e.type == pygame.QUIT:
                     self.running = False
                 else:
@@ -313,6 +438,7 @@ class App:
                         self.current_scene.handle_event(e)
 
             # --- 업데이트 & 그리기 ---
+            damage = None
             if self.transition is not None:
                 # fade-in 단계에 들어간 이후에는 새 씬도 같이 update 해 준다
                 if self.transition.phase == "fade_in" and self.current_scene is not None:
@@ -320,15 +446,24 @@ class App:
 
                 self.transition.update(dt)
                 self.transition.draw(self.screen)
+                self._drawn_scene = None
 
                 if self.transition.finished:
                     self.transition = None
             else:
                 if self.current_scene is not None:
+                    # 화면에 다른 씬 / 전환 화면이 남아 있으면 전체를 다시 그리게 한다
+                    if self.current_scene is not self._drawn_scene:
+                        self.current_scene.invalidate()
+                        self._drawn_scene = self.current_scene
                     self.current_scene.update(dt)
                     self.current_scene.draw(self.screen)
+                    damage = self.current_scene.damage
+
+            self.present(damage)
 
-            pygame.display.flip()
+            # 이번 프레임에 빌려 준 임시 Surface 회수 (+ 할당 통계 갱신)
+            surfaces.end_frame()
 
         pygame.quit()
         sys.exit()
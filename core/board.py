@@ -13,6 +13,104 @@ class Tile:
         self.number  = 0
         self.state   = C_COVERED
 
+    def copy(self):
+        t = Tile.__new__(Tile)
+        t.is_mine = self.is_mine
+        t.number  = self.number
+        t.state   = self.state
+        return t
+
+class CowTiles:
+    """
+    Board.clone()용 copy-on-write 타일 맵.
+    - base  : 스테이지 초기 타일 dict (모든 클론이 공유, 절대 수정하지 않음)
+    - layers: share() 시점에 얼린 overlay들 (최신 것부터, 여러 클론이 공유, 수정하지 않음)
+    - own   : 이 맵에서 마지막 share() 이후 바뀐 칸만 담는 overlay (이 맵 전용)
+    읽기는 dict처럼 쓰면 되고, 쓰기는 Board 내부에서 writable()로만 한다.
+    클론의 비용은 이후 그 클론이 바꾼 칸 수 k에 대해 O(k)이고,
+    얼린 층이 MAX_LAYERS를 넘으면 그때 한 번 합친다.
+    """
+    __slots__ = ("base", "own", "layers")
+
+    MAX_LAYERS = 8
+
+    def __init__(self, base, layers=()):
+        self.base = base
+        self.own = {}
+        self.layers = layers
+
+    def _lookup(self, pos):
+        t = self.own.get(pos)
+        if t is not None:
+            return t
+        for layer in self.layers:
+            t = layer.get(pos)
+            if t is not None:
+                return t
+        return None
+
+    def __getitem__(self, pos):
+        t = self._lookup(pos)
+        return t if t is not None else self.base[pos]
+
+    def get(self, pos, default=None):
+        t = self._lookup(pos)
+        if t is not None:
+            return t
+        return self.base.get(pos, default)
+
+    def __contains__(self, pos):
+        return pos in self.base
+
+    def __iter__(self):
+        return iter(self.base)
+
+    def __len__(self):
+        return len(self.base)
+
+    def keys(self):
+        return self.base.keys()
+
+    def items(self):
+        if not self.layers:
+            own = self.own
+            for pos, t in self.base.items():
+                o = own.get(pos)
+                yield pos, (o if o is not None else t)
+            return
+        lookup = self._lookup
+        for pos, t in self.base.items():
+            o = lookup(pos)
+            yield pos, (o if o is not None else t)
+
+    def values(self):
+        for _pos, t in self.items():
+            yield t
+
+    def share(self):
+        """
+        클론: 지금까지의 overlay를 얼려서 층으로 올리고, 양쪽 모두 빈 overlay에서 시작한다.
+        보통 O(1). 층이 MAX_LAYERS를 넘을 때만 층 전체를 한 dict로 합친다.
+        """
+        if self.own:
+            layers = (self.own,) + self.layers
+            if len(layers) > self.MAX_LAYERS:
+                merged = {}
+                for layer in reversed(layers):
+                    merged.update(layer)
+                layers = (merged,)
+            self.layers = layers
+            self.own = {}
+        return CowTiles(self.base, self.layers)
+
+    def writable(self, pos):
+        """이 맵 전용 Tile을 돌려준다. 공유 중인 Tile은 건드리지 않고, 칸마다 처음 쓸 때만 복사한다."""
+        t = self.own.get(pos)
+        if t is None:
+            t = self[pos].copy()
+            self.own[pos] = t
+        return t
+
 class Board:
     def __init__(self, grid, stage_data):
         self.grid = grid
@@ -25,6 +123,10 @@ class Board:
         self.mistakes = 0
         self.locked_flags = set()
 
+        # 상태가 바뀐 칸. 화면 청크 캐시(BoardChunks)가 붙을 때 set으로 바꾸고,
+        # 읽을 때마다 비운다. None이면 기록하지 않음 (작은 보드 / 탐색용 클론)
+        self.changed_cells = None
+
         # 차단/지뢰 배치
         for q, r in stage_data.get("blocked", []):
             if (q, r) in self.tiles:
@@ -68,6 +170,64 @@ class Board:
         self.check_win_and_update()
         self.last_flood_open = []
 
+        # 되돌리기/다시하기 저널 (append-only + 커서)
+        # 엔트리: (changes, mistake_delta, won)
+        #   changes = [(pos, old_state, new_state), ...]
+        self.journal = []
+        self.journal_pos = 0
+        self._pending = None
+
+        # clone()과 공유 중인 가변 컨테이너 표시 (처음 쓸 때 복사)
+        self._locked_shared = False
+        self._edge_hints_shared = False
+
+    def clone(self):
+        """
+        탐색용(유일해 검사, 봇, 가정 힌트) 가벼운 복사본.
+        grid / 지뢰·숫자 / number_hint / 엣지 힌트 기하는 그대로 공유하고,
+        칸 상태만 copy-on-write로 분리한다.
+        복사 자체는 O(1), 이후 바뀐 칸 k개에 대해 O(k).
+        저널은 복사하지 않는다(클론은 빈 저널에서 시작).
+        """
+        if not isinstance(self.tiles, CowTiles):
+            self.tiles = CowTiles(self.tiles)
+
+        b = Board.__new__(Board)
+        b.grid = self.grid
+        b.stage = self.stage
+        b.tiles = self.tiles.share()
+        b.number_hint = self.number_hint
+
+        b.edge_hints = self.edge_hints
+        b._edge_hints_shared = self._edge_hints_shared = True
+        b.locked_flags = self.locked_flags
+        b._locked_shared = self._locked_shared = True
+
+        b.is_game_over = self.is_game_over
+        b.is_win = self.is_win
+        b.mistakes = self.mistakes
+        b.total_cells = self.total_cells
+        b.total_mines = self.total_mines
+        b.flag_count = self.flag_count
+        b.revealed_count = self.revealed_count
+        b.mines_left = self.mines_left
+        b.last_flood_open = []
+
+        b.journal = []
+        b.journal_pos = 0
+        b._pending = None
+        # 탐색용 클론은 화면에 그리지 않으므로 변경 칸을 기록하지 않는다
+        b.changed_cells = None
+        return b
+
+    def set_edge_hint_flag(self, idx, key, value):
+        """엣지 힌트 UI 플래그(helper_on / dimmed) 변경. 클론과 공유 중이면 엔트리를 전부 복사."""
+        if self._edge_hints_shared:
+            # 공유를 끊은 뒤에는 어떤 인덱스를 바꿔도 클론에 새지 않도록 엔트리 dict까지 복사
+            self.edge_hints = [dict(e) for e in self.edge_hints]
+            self._edge_hints_shared = False
+        self.edge_hints[idx][key] = value
+
     def line_cells(self, q, r, dir_idx):
         """pos=(q,r)에서 dir 방향으로 필드 안쪽 끝까지 좌표를 나열."""
         dq, dr = DIRECTIONS[dir_idx]
@@ -129,6 +289,124 @@ class Board:
         self.revealed_count = sum(1 for t in self.tiles.values() if t.state == C_REVEALED and not t.is_mine)
         self.mines_left = max(0, self.total_mines - self.flag_count)
 
+    # ---------- 상태 변경 / 저널 ----------
+    def _set_state(self, pos, new_state):
+        """셀 상태를 바꾸면서 카운터와 잠금 깃발을 O(1)로 갱신하고 저널에 기록."""
+        t = self.tiles[pos]
+        old_state = t.state
+        if old_state == new_state:
+            return
+        self._write_state(pos, new_state)
+        if self._pending is not None:
+            self._pending.append((pos, old_state, new_state))
+
+    def _write_state(self, pos, new_state):
+        tiles = self.tiles
+        t = tiles[pos] if tiles.__class__ is dict else tiles.writable(pos)
+        old_state = t.state
+        if old_state == C_FLAGGED:
+            self.flag_count -= 1
+        elif old_state == C_REVEALED and not t.is_mine:
+            self.revealed_count -= 1
+
+        t.state = new_state
+        if self.changed_cells is not None:
+            self.changed_cells.add(pos)
+
+        if new_state == C_FLAGGED:
+            self.flag_count += 1
+        elif new_state == C_REVEALED and not t.is_mine:
+            self.revealed_count += 1
+
+        # 지뢰 칸은 깃발이 꽂혀 있는 동안만 잠금
+        if t.is_mine:
+            if self._locked_shared:
+                self.locked_flags = set(self.locked_flags)
+                self._locked_shared = False
+            if new_state == C_FLAGGED:
+                self.locked_flags.add(pos)
+            else:
+                self.locked_flags.discard(pos)
+        self.mines_left = max(0, self.total_mines - self.flag_count)
+
+    def _begin(self):
+        self._pending = []
+
+    def _commit(self, mistake_delta=0):
+        """이번 조작(클릭 1번 = flood fill 포함 1엔트리)을 저널에 추가."""
+        changes = self._pending or []
+        self._pending = None
+        if not changes and not mistake_delta:
+            return
+        # 되돌린 뒤 새 조작을 하면 redo 꼬리는 버림
+        del self.journal[self.journal_pos:]
+        self.journal.append((changes, mistake_delta, self.is_win))
+        self.journal_pos = len(self.journal)
+
+    def can_undo(self) -> bool:
+        return self.journal_pos > 0
+
+    def can_redo(self) -> bool:
+        return self.journal_pos < len(self.journal)
+
+    def undo(self):
+        """마지막 엔트리를 되돌린다. 비용은 바뀐 칸 수에 비례."""
+        if not self.can_undo():
+            return None
+        self.journal_pos -= 1
+        changes, mistake_delta, _won = self.journal[self.journal_pos]
+        for pos, old_state, _new_state in reversed(changes):
+            self._write_state(pos, old_state)
+        self.mistakes -= mistake_delta
+        # 게임 오버 상태에서는 조작이 막히므로, 엔트리 이전은 항상 진행 중
+        self.is_game_over = False
+        self.is_win = False
+        self.last_flood_open = []
+        return changes
+
+    def redo(self):
+        """되돌린 엔트리를 다시 적용한다."""
+        if not self.can_redo():
+            return None
+        changes, mistake_delta, won = self.journal[self.journal_pos]
+        self.journal_pos += 1
+        for pos, _old_state, new_state in changes:
+            self._write_state(pos, new_state)
+        self.mistakes += mistake_delta
+        self.is_game_over = won
+        self.is_win = won
+        self.last_flood_open = []
+        return changes
+
+    def dump_journal(self):
+        """
+        JSON으로 저장 가능한 압축 형태.
+        엔트리 하나 = [mistake_delta, won, q, r, (old<<2)|new, q, r, ...] 정수 리스트
+        """
+        entries = []
+        for changes, mistake_delta, won in self.journal:
+            flat = [int(mistake_delta), int(won)]
+            for (q, r), old_state, new_state in changes:
+                flat.extend((q, r, (old_state << 2) | new_state))
+            entries.append(flat)
+        return {"pos": self.journal_pos, "entries": entries}
+
+    def load_journal(self, data):
+        """dump_journal 결과를 새 보드(초기 상태)에 적용한다."""
+        journal = []
+        for flat in data.get("entries", []):
+            changes = []
+            for i in range(2, len(flat) - 2, 3):
+                code = int(flat[i + 2])
+                changes.append(((int(flat[i]), int(flat[i + 1])), code >> 2, code & 3))
+            journal.append((changes, int(flat[0]), bool(flat[1])))
+
+        self.journal = journal
+        self.journal_pos = 0
+        target = max(0, min(len(journal), int(data.get("pos", len(journal)))))
+        while self.journal_pos < target:
+            self.redo()
+
     def toggle_flag(self, q, r):
         if self.is_game_over:
             return
@@ -138,27 +416,30 @@ class Board:
         
         pos = (q, r)
 
+        self._begin()
         if t.state == C_FLAGGED:
             # 잠금(=지뢰 깃발)인 경우 해제 불가
             if pos in self.locked_flags:
+                self._pending = None
                 return
             # 잠금이 아니면(안전칸에 있었던 시작 깃발 등) 해제 허용
-            t.state = C_COVERED
-            self.recompute_counters()
+            self._set_state(pos, C_COVERED)
             self.check_win_and_update()
+            self._commit()
             return
 
         # 여기 오면 C_COVERED
+        mistake_delta = 0
         if t.is_mine:
             # 지뢰면 깃발 + 잠금
-            t.state = C_FLAGGED
-            self.locked_flags.add(pos)
+            self._set_state(pos, C_FLAGGED)
         else:
             # 안전칸이면 깃발 금지: 실수 +1만, 상태는 그대로
             self.mistakes += 1
+            mistake_delta = 1
 
-        self.recompute_counters()
         self.check_win_and_update()
+        self._commit(mistake_delta)
 
     def reveal(self, q, r):
         if self.is_game_over:
@@ -181,11 +462,13 @@ class Board:
         if t.is_mine:
             self.mistakes += 1
             self.check_win_and_update()
+            self._begin()
+            self._commit(1)
             return
 
-        # 안전칸 공개 (클릭한 칸)
-        t.state = C_REVEALED
-        self.revealed_count += 1
+        # 안전칸 공개 (클릭한 칸) — flood fill까지 한 엔트리로 기록
+        self._begin()
+        self._set_state((q, r), C_REVEALED)
 
         opened_chain = []
         # 숫자 0이면 연쇄 공개
@@ -197,6 +480,7 @@ class Board:
 
         # 승리 조건 갱신
         self.check_win_and_update()
+        self._commit()
 
     def flood_fill_open(self, start_pos):
         if start_pos not in self.tiles:
@@ -228,9 +512,8 @@ class Board:
 
                 # 새로 여는 경우에만 카운트 + 리스트에 기록
                 if t.state != C_REVEALED:
-                    t.state = C_REVEALED
-                    # 안전칸만 카운팅
-                    self.revealed_count += 1
+                    # 안전칸만 카운팅 (_set_state에서 처리)
+                    self._set_state(nb, C_REVEALED)
                     opened.append(nb)
 
                 # 0이면 큐에 추가(더 확장)
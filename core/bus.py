@@ -0,0 +1,54 @@
+# core/bus.py
+import weakref
+
+# 토픽 이름
+RESOLUTION_CHANGED = "resolution"      # size=(w, h)  씬이 그리는 화면 크기가 바뀜
+DISPLAY_MODE_CHANGED = "display_mode"  # index=int   창 / 전체 화면 전환
+STAGE_LOADED = "stage_loaded"          # path=str, board=Board, hex_size=int
+VOLUME_CHANGED = "volume"              # bgm=float, sfx=float
+PROGRESS_CHANGED = "progress"          # max_unlocked=int  (저장 직후)
+
+
+class EventBus:
+    """
+    캐시 무효화용 아주 작은 publish / subscribe 버스 (App.bus).
+
+    레이아웃 / 스프라이트 캐시가 매 프레임 크기를 비교하는 대신
+    필요한 토픽에 구독해 두고 바뀔 때만 갱신한다.
+    - 바운드 메서드는 약한 참조로 들고 있으므로, 주인 객체가 사라지면
+      구독도 자동으로 빠진다. 씬은 순환 참조로 GC 전까지 남으므로
+      Scene.subscribe / on_exit으로 교체 시점에 직접 해제한다.
+    - 구독 순서대로 호출된다.
+    """
+
+    def __init__(self):
+        self._subs = {}   # topic -> [ref, ...]
+
+    def subscribe(self, topic, callback):
+        if hasattr(callback, "__self__") and callback.__self__ is not None:
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda cb=callback: cb
+        self._subs.setdefault(topic, []).append(ref)
+        return callback
+
+    def unsubscribe(self, topic, callback):
+        refs = self._subs.get(topic)
+        if refs:
+            self._subs[topic] = [r for r in refs if r() not in (None, callback)]
+
+    def publish(self, topic, **payload):
+        refs = self._subs.get(topic)
+        if not refs:
+            return
+        n = len(refs)
+        alive = []
+        for ref in refs[:n]:
+            cb = ref()
+            if cb is None:
+                continue
+            alive.append(ref)
+            cb(**payload)
+        # 죽은 구독 정리 (콜백 안에서 새로 구독한 것은 유지)
+        added = self._subs.get(topic, [])[n:]
+        self._subs[topic] = alive + added
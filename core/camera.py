@@ -0,0 +1,154 @@
+# core/camera.py
+import math
+import weakref
+from bisect import bisect_left, bisect_right
+from .hexmath import pixel_to_axial, SQRT3
+
+
+class Camera:
+    """
+    GameplayScene용 보드 카메라 (이동 + 확대/축소).
+
+    - size   : 실제로 그릴 hex 크기 (정수 → 스프라이트 / 히트맵 캐시 key가 안정적)
+    - center : 화면에서 보드 (0, 0) 타일 중심이 놓이는 위치 (정수)
+    zoom=1, pan=(0, 0)이면 기존처럼 화면 중앙에 스테이지 hex_size로 그린다.
+    """
+
+    MIN_SIZE = 6
+    MAX_SIZE = 96
+    ZOOM_STEP = 1.15
+
+    def __init__(self, base_size):
+        self.base_size = int(base_size)
+        self.zoom = 1.0
+        self.pan_x = 0
+        self.pan_y = 0
+
+    @property
+    def size(self):
+        s = int(round(self.base_size * self.zoom))
+        return max(self.MIN_SIZE, min(self.MAX_SIZE, s))
+
+    def center(self, screen_size):
+        w, h = screen_size
+        return (w // 2 + self.pan_x, h // 2 + self.pan_y)
+
+    def reset(self):
+        self.zoom = 1.0
+        self.pan_x = 0
+        self.pan_y = 0
+
+    # ----- 좌표 변환 -----
+    def to_local(self, x, y, screen_size):
+        """화면 좌표 → 보드 (0, 0) 타일 중심 기준 로컬 좌표 (히트맵 / 청크 좌표계)."""
+        cx, cy = self.center(screen_size)
+        return (x - cx, y - cy)
+
+    def to_axial(self, x, y, screen_size):
+        """화면 좌표 → 그 아래 hex의 axial (q, r). 보드에 있는 칸인지는 보지 않는다."""
+        lx, ly = self.to_local(x, y, screen_size)
+        return pixel_to_axial(lx, ly, self.size)
+
+    # ----- 조작 -----
+    def pan_by(self, dx, dy):
+        self.pan_x += int(dx)
+        self.pan_y += int(dy)
+
+    def zoom_at(self, steps, anchor, screen_size):
+        """anchor(화면 좌표) 아래의 보드 지점이 그대로 있도록 steps 단계만큼 확대/축소."""
+        old_size = self.size
+        zoom = self.zoom * (self.ZOOM_STEP ** steps)
+        lo = self.MIN_SIZE / self.base_size
+        hi = self.MAX_SIZE / self.base_size
+        self.zoom = max(lo, min(hi, zoom))
+
+        new_size = self.size
+        if new_size == old_size:
+            return
+
+        ax, ay = anchor
+        cx, cy = self.center(screen_size)
+        k = new_size / old_size
+        w, h = screen_size
+        self.pan_x = int(round(ax - (ax - cx) * k)) - w // 2
+        self.pan_y = int(round(ay - (ay - cy) * k)) - h // 2
+
+
+class CellIndex:
+    """
+    보드 셀을 q 열(column)별로 r 정렬해 둔 인덱스.
+    화면 사각형과 겹치는 셀만 뽑아서, 원래 순서(board.tiles 순회 순서) 그대로 돌려준다.
+    hex_size 1 기준 보드 전체 bbox도 들고 있어서 전부 보이면 바로 None을 돌려준다.
+    """
+
+    def __init__(self, cells):
+        self.order = {}
+        cols = {}
+        for i, pos in enumerate(cells):
+            self.order[pos] = i
+            cols.setdefault(pos[0], []).append(pos[1])
+
+        self.cols = {}
+        for q, rs in cols.items():
+            rs.sort()
+            self.cols[q] = rs
+
+        # hex_size = 1 기준 타일 중심 bbox
+        if self.order:
+            xs = [1.5 * q for (q, r) in self.order]
+            ys = [SQRT3 * (r + q * 0.5) for (q, r) in self.order]
+            self.bounds = (min(xs), min(ys), max(xs), max(ys))
+            self.q_min = min(self.cols)
+            self.q_max = max(self.cols)
+        else:
+            self.bounds = (0.0, 0.0, 0.0, 0.0)
+            self.q_min = self.q_max = 0
+
+    def visible(self, center, size, rect):
+        """
+        rect(화면 좌표)와 겹칠 수 있는 셀 목록.
+        보드 전체가 rect 안에 들어오면 None (= 전부 그리면 됨).
+        """
+        cx, cy = center
+        # 타일 반경만큼 여유 (하이라이트 선 두께 포함)
+        m = size * 1.25
+        x0 = rect[0] - cx - m
+        y0 = rect[1] - cy - m
+        x1 = rect[0] + rect[2] - cx + m
+        y1 = rect[1] + rect[3] - cy + m
+
+        bx0, by0, bx1, by1 = self.bounds
+        if x0 <= bx0 * size and y0 <= by0 * size and bx1 * size <= x1 and by1 * size <= y1:
+            return None
+
+        col_w = 1.5 * size
+        row_h = SQRT3 * size
+        q_lo = max(self.q_min, math.ceil(x0 / col_w))
+        q_hi = min(self.q_max, math.floor(x1 / col_w))
+
+        out = []
+        for q in range(q_lo, q_hi + 1):
+            rs = self.cols.get(q)
+            if not rs:
+                continue
+            r_lo = y0 / row_h - q * 0.5
+            r_hi = y1 / row_h - q * 0.5
+            i0 = bisect_left(rs, math.ceil(r_lo))
+            i1 = bisect_right(rs, math.floor(r_hi))
+            for r in rs[i0:i1]:
+                out.append((q, r))
+
+        order = self.order
+        out.sort(key=order.__getitem__)
+        return out
+
+
+_cell_indexes = weakref.WeakKeyDictionary()
+
+def cell_index(board):
+    """보드별 CellIndex 캐시 (셀 구성은 게임 중에 바뀌지 않는다)."""
+    idx = _cell_indexes.get(board)
+    if idx is None:
+        idx = CellIndex(board.tiles)
+        _cell_indexes[board] = idx
+    return idx
@@ -0,0 +1,205 @@
+# core/chunks.py
+import math
+from collections import OrderedDict
+import pygame
+from .hexmath import axial_to_pixel, SQRT3
+from . import surfaces
+
+
+class BoardChunks:
+    """
+    큰 보드용 청크 캐시.
+
+    보드를 CHUNK x CHUNK 칸짜리 axial 청크로 나누고, 청크마다 타일을 한 장의
+    SRCALPHA 서피스에 구워 둔다. 매 프레임은 화면과 겹치는 청크를 blit만 한다.
+    - 청크 좌표 (cq, ck): cq = q // CHUNK, ck = (r + q // 2) // CHUNK
+      (열마다 반 칸씩 어긋나는 flat-top 배치를 세로로 펴서, 청크가 거의 직사각형이 되게)
+    - 청크는 BAKE_SIZES 중 하나(현재 hex 크기 이상인 가장 작은 값)로만 굽고,
+      현재 크기로 줄인 결과는 현재 크기에 대해서만 따로 들고 있는다.
+      → 줌 단계마다 타일을 다시 그리지 않고 보이는 청크를 한 번씩 축소만 한다.
+      (BAKE_SIZES보다 크게 확대하면 그 크기로 직접 굽는다. 보이는 청크가 몇 개뿐)
+    - 타일 상태가 바뀌면 board.changed_cells에 기록되고, 다음 draw()에서
+      그 칸이 속한 청크만 다시 굽는다.
+    - 구운 서피스는 LRU로 들고 있고, 픽셀 수 합이 MAX_PIXELS를 넘으면
+      가장 오래 안 보인 청크부터 버린다 (이번 프레임에 그린 청크는 남김).
+    """
+
+    CHUNK = 16
+    MAX_PIXELS = 16 * 1024 * 1024   # RGBA 기준 약 64MB
+    # 인접 값 비율 1.5 이하 (축소 품질), 9 / 6은 숫자를 생략하는 LOD 크기
+    BAKE_SIZES = (6, 9, 12, 18, 24, 36, 48)
+
+    def __init__(self, board, paint, highlight_size):
+        self.board = board
+        self.paint = paint     # paint(surface, board, q, r, tile, x, y, size, font, highlight=None)
+        self.highlight_size = highlight_size   # size -> 하이라이트 임시 서피스 크기
+
+        n = self.CHUNK
+        self.cells = {}        # (cq, ck) -> [(q, r), ...] (board.tiles 순서)
+        for pos in board.tiles:
+            q, r = pos
+            self.cells.setdefault((q // n, (r + (q >> 1)) // n), []).append(pos)
+
+        if self.cells:
+            self.cq_min = min(c[0] for c in self.cells)
+            self.cq_max = max(c[0] for c in self.cells)
+            self.ck_min = min(c[1] for c in self.cells)
+            self.ck_max = max(c[1] for c in self.cells)
+        else:
+            self.cq_min = self.cq_max = self.ck_min = self.ck_max = 0
+
+        self.rev = {}                  # (cq, ck) -> 변경 횟수
+        self._sprites = OrderedDict()  # (bake_size, (cq, ck)) -> (sprite, 로컬 topleft, rev)
+        self._pixels = 0
+        self._font = None
+
+        # 현재 hex 크기로 축소한 청크: (cq, ck) -> (sprite, 로컬 topleft, 원본 sprite)
+        self._scaled = {}
+        self._scaled_size = None
+
+        # 이 캐시가 생긴 뒤부터 변경 칸을 기록하게 한다 (작은 보드는 기록 안 함)
+        board.changed_cells = set()
+
+    # ----- 무효화 -----
+    def _sync(self, font):
+        if font is not self._font:
+            self._font = font
+            self.clear()
+
+        changed = self.board.changed_cells
+        if changed:
+            n = self.CHUNK
+            rev = self.rev
+            for q, r in changed:
+                cid = (q // n, (r + (q >> 1)) // n)
+                rev[cid] = rev.get(cid, 0) + 1
+            changed.clear()
+
+    def clear(self):
+        self._sprites.clear()
+        self._pixels = 0
+        self._scaled = {}
+
+    # ----- 청크 굽기 -----
+    @classmethod
+    def bake_size(cls, size):
+        for s in cls.BAKE_SIZES:
+            if s >= size:
+                return s
+        return size
+
+    def chunk_bounds(self, cid, size):
+        """hex_size 기준, 보드 (0, 0) 로컬 좌표의 청크 영역 (left, top, right, bottom)."""
+        n = self.CHUNK
+        cq, ck = cid
+        # 하이라이트 선이 윗변 밖으로 조금 나가므로 여유를 둔다
+        m = size // 5 + 3
+        left = 1.5 * size * cq * n - size - m
+        right = 1.5 * size * (cq * n + n - 1) + size + m
+        top = SQRT3 * size * (ck * n - 0.5) - m
+        bottom = SQRT3 * size * (ck * n + n) + m
+        return (math.floor(left), math.floor(top), math.ceil(right), math.ceil(bottom))
+
+    def _bake(self, cid, size, font):
+        left, top, right, bottom = self.chunk_bounds(cid, size)
+        sprite = surfaces.new_surface((right - left, bottom - top))
+        # 하이라이트용 임시 서피스는 청크 하나에 한 장만 빌려서 타일끼리 돌려 쓴다
+        highlight = surfaces.scratch(self.highlight_size(size), clear=False)
+        tiles = self.board.tiles
+        paint = self.paint
+        for q, r in self.cells[cid]:
+            x, y = axial_to_pixel(q, r, size)
+            paint(sprite, self.board, q, r, tiles[(q, r)], x - left, y - top, size, font,
+                  highlight=highlight)
+        return sprite, (left, top)
+
+    def _get(self, cid, size, font):
+        key = (size, cid)
+        rev = self.rev.get(cid, 0)
+        entry = self._sprites.get(key)
+        if entry is not None and entry[2] == rev:
+            self._sprites.move_to_end(key)
+            return entry
+
+        if entry is not None:
+            self._pixels -= entry[0].get_width() * entry[0].get_height()
+        sprite, topleft = self._bake(cid, size, font)
+        entry = (sprite, topleft, rev)
+        self._sprites[key] = entry
+        self._sprites.move_to_end(key)
+        self._pixels += sprite.get_width() * sprite.get_height()
+        return entry
+
+    def _get_scaled(self, cid, size, font):
+        """현재 size용 청크 (BAKE_SIZES 크기로 구운 것을 축소, 같은 크기면 그대로)."""
+        base = self.bake_size(size)
+        sprite, (left, top), _rev = self._get(cid, base, font)
+        if base == size:
+            return sprite, (left, top)
+
+        cached = self._scaled.get(cid)
+        if cached is not None and cached[2] is sprite:
+            return cached[0], cached[1]
+
+        k = size / base
+        w = max(1, round(sprite.get_width() * k))
+        h = max(1, round(sprite.get_height() * k))
+        scaled = pygame.transform.smoothscale(sprite, (w, h))
+        topleft = (round(left * k), round(top * k))
+        self._scaled[cid] = (scaled, topleft, sprite)
+        return scaled, topleft
+
+    def _evict(self, keep):
+        sprites = self._sprites
+        while self._pixels > self.MAX_PIXELS and len(sprites) > keep:
+            _key, (sprite, _tl, _rev) = sprites.popitem(last=False)
+            self._pixels -= sprite.get_width() * sprite.get_height()
+
+    # ----- 그리기 -----
+    def visible_chunks(self, center, size, rect):
+        """rect(화면 좌표)와 겹치는 청크 id 목록."""
+        cx, cy = center
+        n = self.CHUNK
+        col_w = 1.5 * size * n
+        row_h = SQRT3 * size * n
+        # 청크 영역은 이웃 청크와 hex 하나 정도 겹치므로 한 칸씩 넓게 본다
+        x0 = rect[0] - cx
+        y0 = rect[1] - cy
+        x1 = x0 + rect[2]
+        y1 = y0 + rect[3]
+        cq0 = max(self.cq_min, math.floor(x0 / col_w) - 1)
+        cq1 = min(self.cq_max, math.floor(x1 / col_w) + 1)
+        ck0 = max(self.ck_min, math.floor(y0 / row_h) - 1)
+        ck1 = min(self.ck_max, math.floor(y1 / row_h) + 1)
+
+        out = []
+        cells = self.cells
+        for cq in range(cq0, cq1 + 1):
+            for ck in range(ck0, ck1 + 1):
+                cid = (cq, ck)
+                if cid not in cells:
+                    continue
+                left, top, right, bottom = self.chunk_bounds(cid, size)
+                if right + cx <= rect[0] or left + cx >= rect[0] + rect[2]:
+                    continue
+                if bottom + cy <= rect[1] or top + cy >= rect[1] + rect[3]:
+                    continue
+                out.append(cid)
+        return out
+
+    def draw(self, surface, center, size, font):
+        self._sync(font)
+        if size != self._scaled_size:
+            self._scaled_size = size
+            self._scaled = {}
+
+        cx, cy = center
+        visible = self.visible_chunks(center, size, surface.get_clip())
+        for cid in visible:
+            sprite, (left, top) = self._get_scaled(cid, size, font)
+            surface.blit(sprite, (left + cx, top + cy))
+
+        # 축소본은 지금 보이는 청크 것만 남긴다
+        if len(self._scaled) > len(visible):
+            self._scaled = {cid: self._scaled[cid] for cid in visible if cid in self._scaled}
+        self._evict(keep=len(visible))
@@ -0,0 +1,77 @@
+# core/hitmap.py
+import math
+from bisect import bisect_right
+from .hexmath import axial_to_pixel, SQRT3
+
+
+class HexHitMap:
+    """
+    화면 픽셀 → 보드 타일 / 테두리 숫자 라벨을 찾는 행(row) 스팬 인덱스.
+
+    (stage, hex_size, 화면 크기)마다 한 번만 만들고 재사용한다.
+    해상도가 바뀌면 key가 달라지므로 새로 만들면 된다.
+    - 한 행(y)마다 타일 스팬 [x0, x1]을 x 순으로 정렬해 두고 bisect로 찾는다.
+    - 라벨은 원(반지름 radius) 모양을 행 스팬으로 래스터화해 둔다.
+      (기존 edge_hint_hit_test처럼 인덱스가 작은 라벨이 우선)
+    """
+
+    def __init__(self, cells, center, size, labels=(), key=None):
+        self.key = key
+        self.center = center
+        self.size = size
+
+        cx, cy = center
+        half_h = size * SQRT3 / 2.0
+
+        # --- 타일 스팬 (육각형 = 픽셀 공간에서 겹치지 않는 타일링) ---
+        rows = {}
+        for pos in cells:
+            x, y = axial_to_pixel(pos[0], pos[1], size)
+            x += cx
+            y += cy
+            for py in range(math.ceil(y - half_h), math.floor(y + half_h) + 1):
+                hw = size - abs(py - y) / SQRT3
+                x0 = math.ceil(x - hw)
+                x1 = math.floor(x + hw)
+                if x0 <= x1:
+                    rows.setdefault(py, []).append((x0, x1, pos))
+
+        self._rows = {}
+        for py, spans in rows.items():
+            spans.sort(key=lambda s: s[0])
+            self._rows[py] = (
+                [s[0] for s in spans],
+                [s[1] for s in spans],
+                [s[2] for s in spans],
+            )
+
+        # --- 라벨 스팬 (원 내부: dx^2 + dy^2 <= r^2) ---
+        self._label_rows = {}
+        for idx, (lx, ly, r) in enumerate(labels):
+            for py in range(math.ceil(ly - r), math.floor(ly + r) + 1):
+                dy = py - ly
+                hw = math.sqrt(max(0.0, r * r - dy * dy))
+                x0 = math.ceil(lx - hw)
+                x1 = math.floor(lx + hw)
+                if x0 <= x1:
+                    self._label_rows.setdefault(py, []).append((x0, x1, idx))
+
+    def tile_at(self, x, y):
+        """픽셀 (x, y) 아래의 타일 좌표 (q, r). 보드 밖이면 None."""
+        row = self._rows.get(int(y))
+        if row is None:
+            return None
+        starts, ends, cells = row
+        i = bisect_right(starts, x) - 1
+        if i >= 0 and x <= ends[i]:
+            return cells[i]
+        return None
+
+    def edge_hint_at(self, x, y):
+        """픽셀 (x, y) 아래의 테두리 숫자 인덱스. 없으면 None."""
+        spans = self._label_rows.get(int(y))
+        if spans:
+            for x0, x1, idx in spans:
+                if x0 <= x <= x1:
+                    return idx
+        return None
@@ -0,0 +1,102 @@
+# core/input.py
+import pygame
+
+
+class FrameInput:
+    """
+    메인 루프의 입력 단계.
+    한 프레임 동안 쌓인 이벤트를 한 번에 가져와서
+    - 연달아 들어온 MOUSEMOTION은 마지막 하나로 합치고 (rel은 누적)
+    - 클릭 / 키 입력 등 나머지 이벤트는 순서를 그대로 유지한다.
+    → 마우스 폴링 속도와 상관없이 씬의 호버 처리는 프레임당 거의 일정.
+
+    프레임 통계(마지막 collect 기준):
+      frame_raw / frame_delivered      : 받은 이벤트 수 / 씬에 넘긴 이벤트 수
+      frame_motion_raw / frame_motion_delivered
+      frame_clicks                     : MOUSEBUTTONDOWN 수
+    누적 통계: total_raw / total_delivered / frames
+
+    pos_transform: 지정하면 마우스 이벤트의 pos를 이 함수로 바꿔서 넘긴다.
+                   (논리 해상도 렌더링에서 창 좌표 → 논리 좌표)
+    rel_transform: 지정하면 MOUSEMOTION의 rel(이동량)을 이 함수로 바꿔서 넘긴다.
+                   (pos_transform과 같은 배율, 위치 이동 없이 크기만)
+    """
+
+    _POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+    def __init__(self):
+        self.pos_transform = None
+        self.rel_transform = None
+        self.frames = 0
+        self.total_raw = 0
+        self.total_delivered = 0
+        self._reset_frame()
+
+    def _reset_frame(self):
+        self.frame_raw = 0
+        self.frame_delivered = 0
+        self.frame_motion_raw = 0
+        self.frame_motion_delivered = 0
+        self.frame_clicks = 0
+
+    @staticmethod
+    def _merge_motion(last, count, rx, ry):
+        if count == 1:
+            return last
+        data = dict(last.dict)
+        data["rel"] = (rx, ry)
+        return pygame.event.Event(pygame.MOUSEMOTION, data)
+
+    def collect(self, events=None):
+        """이번 프레임 이벤트를 합쳐서 리스트로 돌려준다."""
+        if events is None:
+            events = pygame.event.get()
+
+        self._reset_frame()
+        out = []
+
+        last = None      # 진행 중인 MOUSEMOTION 묶음의 마지막 이벤트
+        count = 0
+        rx = ry = 0
+
+        pos_transform = self.pos_transform
+        rel_transform = self.rel_transform
+
+        for e in events:
+            self.frame_raw += 1
+            if pos_transform is not None and e.type in self._POINTER_EVENTS:
+                data = dict(e.dict)
+                data["pos"] = pos_transform(e.pos)
+                if rel_transform is not None and "rel" in data:
+                    data["rel"] = rel_transform(data["rel"])
+                e = pygame.event.Event(e.type, data)
+            if e.type == pygame.MOUSEMOTION:
+                self.frame_motion_raw += 1
+                last = e
+                count += 1
+                rel = getattr(e, "rel", (0, 0))
+                rx += rel[0]
+                ry += rel[1]
+                continue
+
+            # 모션이 아닌 이벤트 앞에서 묶음을 끊어서 순서를 보존
+            if last is not None:
+                out.append(self._merge_motion(last, count, rx, ry))
+                self.frame_motion_delivered += 1
+                last = None
+                count = 0
+                rx = ry = 0
+
+            if e.type == pygame.MOUSEBUTTONDOWN:
+                self.frame_clicks += 1
+            out.append(e)
+
+        if last is not None:
+            out.append(self._merge_motion(last, count, rx, ry))
+            self.frame_motion_delivered += 1
+
+        self.frame_delivered = len(out)
+        self.frames += 1
+        self.total_raw += self.frame_raw
+        self.total_delivered += self.frame_delivered
+        return out
@@ -1,6 +1,10 @@
 import pygame
 import math
+import weakref
 from .hexmath import axial_to_pixel, hex_corners
+from . import surfaces
+from .camera import cell_index
+from .chunks import BoardChunks
 from .board import C_BLOCKED, C_COVERED, C_FLAGGED, C_REVEALED
 from settings import (
     COL_COVERED, COL_MINE, COL_TEXT, EDGE_HINT_OFFSET
@@ -60,6 +64,118 @@ def edge_label_center(board, ent, center, size):
     py = ay + (off_dy / off_norm) * offset
     return px, py
 
+def edge_label_angle(ent, size):
+    """라벨 회전 각도(도). JSON label_angle 우선, 없으면 dir 기준으로 계산."""
+    custom_angle = ent.get("label_angle", None)
+    if isinstance(custom_angle, (int, float)):
+        return float(custom_angle)
+    # 회전 기준 벡터는 dir(보드 안쪽) — 숫자가 '지뢰가 있는 열'을 바라봄
+    rot_dx, rot_dy = dir_pixel(size, int(ent["dir"]))
+    angle_deg = math.degrees(math.atan2(-rot_dy, rot_dx))
+    if angle_deg > 90:
+        angle_deg -= 180
+    elif angle_deg < -90:
+        angle_deg += 180
+    return angle_deg
+
+class EdgeHintLayout:
+    """
+    테두리 숫자 라벨의 중심/회전 각도/히트 반지름을 (보드, hex_size)마다
+    한 번만 계산해 두고, 작은 격자(spatial grid)에 넣어 둔다.
+    좌표는 보드 (0, 0) 기준 로컬이므로 카메라 이동(center 변경)에는 다시 만들지 않는다.
+    draw_edge_hints와 edge_hint_hit_test가 모두 여기서 읽는다.
+    """
+    def __init__(self, board, size, radius=20):
+        self.key = (size, radius)
+        self.centers = []
+        self.angles = []
+        self.radii = []
+        self.cell = max(1, int(radius * 2))
+        self.grid = {}
+
+        for idx, ent in enumerate(getattr(board, "edge_hints", [])):
+            px, py = edge_label_center(board, ent, (0, 0), size)
+            self.centers.append((px, py))
+            self.angles.append(edge_label_angle(ent, size))
+            self.radii.append(radius)
+
+            # 원의 bbox가 걸치는 격자 칸마다 등록 (idx 오름차순 유지)
+            c = self.cell
+            for gx in range(int((px - radius) // c), int((px + radius) // c) + 1):
+                for gy in range(int((py - radius) // c), int((py + radius) // c) + 1):
+                    self.grid.setdefault((gx, gy), []).append(idx)
+
+    def hit_test(self, pos):
+        """pos: 보드 로컬 좌표 (화면 좌표 - center)."""
+        mx, my = pos
+        c = self.cell
+        for idx in self.grid.get((int(mx // c), int(my // c)), ()):
+            px, py = self.centers[idx]
+            r = self.radii[idx]
+            dx = mx - px
+            dy = my - py
+            if dx*dx + dy*dy <= r*r:
+                return idx
+        return None
+
+_edge_layouts = weakref.WeakKeyDictionary()
+
+def edge_hint_layout(board, size, radius=20):
+    """보드별 EdgeHintLayout 캐시 (로컬 좌표). hex_size/radius가 바뀌면 다시 만든다."""
+    layout = _edge_layouts.get(board)
+    if layout is None or layout.key != (size, radius):
+        layout = EdgeHintLayout(board, size, radius)
+        _edge_layouts[board] = layout
+    return layout
+
+# 보조선 스프라이트: 보드별 {(idx, hex_size): (sprite, 로컬 topleft) 또는 None}
+# 보드 (0, 0) 기준 로컬 좌표로 구워 두므로 카메라를 움직여도 그대로 재사용된다.
+_edge_helpers = weakref.WeakKeyDictionary()
+HELPER_MARGIN = 4   # 보조선 스프라이트 여백 (선 두께 3px 기준)
+
+def edge_helper_sprite(board, idx, size):
+    """
+    idx번 힌트의 보조선을 딱 맞는 크기의 SRCALPHA 스프라이트로 한 번만 굽는다.
+    차단 타일은 게임 중 바뀌지 않으므로 (보드, hex_size)가 같으면 재사용.
+    반환: (sprite, 로컬 topleft) 또는 None — 화면 위치는 topleft + center
+    """
+    helpers = _edge_helpers.get(board)
+    if helpers is None:
+        helpers = {}
+        _edge_helpers[board] = helpers
+    key = (idx, size)
+    if key in helpers:
+        return helpers[key]
+
+    ent = board.edge_hints[idx]
+    # board.line_cells 사용해서 해당 줄의 셀들 얻기
+    path = board.line_cells(ent["pos"][0], ent["pos"][1], int(ent["dir"]))
+    # 차단된 셀은 제외
+    path_play = [
+        (q, r) for (q, r) in path
+        if board.tiles[(q, r)].state != C_BLOCKED
+    ]
+
+    entry = None
+    if len(path_play) >= 2:
+        pts = [axial_to_pixel(q, r, size) for (q, r) in path_play]
+
+        # 화면 중심은 정수이므로, 로컬 좌표로 그려도 화면에 직접 그릴 때와 같은 픽셀
+        m = HELPER_MARGIN
+        left = math.floor(min(x for x, _ in pts)) - m
+        top = math.floor(min(y for _, y in pts)) - m
+        right = math.ceil(max(x for x, _ in pts)) + m
+        bottom = math.ceil(max(y for _, y in pts)) + m
+
+        sprite = surfaces.new_surface((right - left, bottom - top))
+        local = [(x - left, y - top) for (x, y) in pts]
+        # 반투명 흰색 보조선
+        pygame.draw.lines(sprite, (255, 255, 255, 120), False, local, 3)
+        entry = (sprite, (left, top))
+
+    helpers[key] = entry
+    return entry
+
 def lighten(color, amount):
     r = min(255, color[0] + amount)
     g = min(255, color[1] + amount)
@@ -97,144 +213,243 @@ def calc_star_count(mistakes: int) -> int:
 
 def draw_board(surface, board, center, size, font):
     cx, cy = center
-    for (q, r), t in board.tiles.items():
-        x, y = axial_to_pixel(q, r, size)
-        x += cx
-        y += cy
-
-        outer_corners = hex_corners((x, y), size - 1)
-        inner_corners = hex_corners((x, y), size - 5)
-
-        # -------- BLOCKED ----------
-        if t.state == C_BLOCKED:
-            continue
-
-        # -------- TILE COLOR LOGIC ----------
-        # 깃발 = 붉은 보호막
-        if t.state == C_FLAGGED:
-            base_color  = darken(COL_MINE, 25)   # 어두운 붉은 바깥
-            inner_color = COL_MINE               # 메인 보호막
-            edge_color  = lighten(COL_MINE, 35)
-
-        # 덮인 타일(회색 금속)
-        elif t.state == C_COVERED:
-            base_color  = COL_COVERED
-            inner_color = lighten(COL_COVERED, 10)
-            edge_color  = darken(COL_COVERED, 18)
-
-        # 안전 타일(REVEALED & not mine)
-        elif t.state == C_REVEALED:
-            # 톤다운된 푸른-회색
-            safe_base  = (70, 100, 125)
-            safe_inner = (90, 130, 160)
-            base_color  = safe_base
-            inner_color = safe_inner
-            edge_color  = lighten(safe_inner, 25)
-
-        else:
-            # 예비
-            base_color  = COL_COVERED
-            inner_color = lighten(COL_COVERED, 10)
-            edge_color  = darken(COL_COVERED, 18)
-
-        # -------- LAYER DRAW ----------
-        pygame.draw.polygon(surface, base_color, outer_corners)
-        pygame.draw.polygon(surface, inner_color, inner_corners)
-        pygame.draw.polygon(surface, edge_color, outer_corners, width=2)
-
-        # -------- TOP HIGHLIGHT (살짝만) ----------
-        highlight_color = (255, 255, 255, 40)
-        highlight_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        top_pts = sorted(outer_corners, key=lambda p: p[1])[:2]
-        pygame.draw.line(
-            highlight_surf, highlight_color,
-            top_pts[0], top_pts[1], width=max(1, size//5)
-        )
-        surface.blit(highlight_surf, (0, 0))
-
-        # -------- 숫자 ----------
-        if t.state == C_REVEALED and not t.is_mine:
-            hint = board.number_hint.get((q, r))
-            label = None
-            if hint == "unknown":
-                label = "?"
-            elif t.number > 0:
-                if hint == "tight":
-                    label = f"{{{t.number}}}"
-                elif hint == "loose":
-                    label = f"-{t.number}-"
-                else:
-                    label = str(t.number)
-
-            if label:
-                txt = font.render(label, True, COL_TEXT)
-                surface.blit(txt, txt.get_rect(center=(x, y)))
 
-def draw_edge_hints(surface, board, center, size, font):
-    if not hasattr(board, "edge_hints"):
+    # 큰 보드는 청크 단위로 구워 둔 서피스를 blit만 한다
+    if len(board.tiles) >= CHUNK_MIN_CELLS:
+        board_chunks(board).draw(surface, center, size, font)
         return
 
-    cx, cy = center
+    # 화면(클립 영역)과 겹치는 타일만 순회. 보드 전체가 보이면 그대로 전부.
+    visible = cell_index(board).visible(center, size, surface.get_clip())
+    tiles = board.tiles
+    items = tiles.items() if visible is None else [(pos, tiles[pos]) for pos in visible]
 
-    for ent in board.edge_hints:
-        d = int(ent["dir"])
-        cnt = int(ent["count"])
-        style = ent["style"]
+    # 하이라이트용 임시 서피스는 한 장만 빌려서 타일끼리 돌려 쓴다
+    highlight = None
+    if size > TILE_STAMP_MAX_SIZE:
+        highlight = surfaces.scratch(highlight_scratch_size(size), clear=False)
 
-        # 라벨 문자열
-        label = f"{{{cnt}}}" if style == "tight" else (f"-{cnt}-" if style == "loose" else str(cnt))
-        img = font.render(label, True, COL_TEXT)
+    for (q, r), t in items:
+        x, y = axial_to_pixel(q, r, size)
+        draw_tile(surface, board, q, r, t, x + cx, y + cy, size, font, highlight=highlight)
+
+# ---- 작은 hex 크기용 LOD ----
+# 이 크기 이하에서는 타일을 상태별로 한 번 구운 스탬프로 blit만 한다
+TILE_STAMP_MAX_SIZE = 18
+# 이보다 작으면 숫자를 읽을 수 없으므로 생략하고, 스탬프도 단색 hex 하나로 줄인다
+LOD_MIN_TEXT_SIZE = 10
+
+def tile_colors(state):
+    """타일 상태 → (base, inner, edge) 색."""
+    # 깃발 = 붉은 보호막
+    if state == C_FLAGGED:
+        base_color  = darken(COL_MINE, 25)   # 어두운 붉은 바깥
+        inner_color = COL_MINE               # 메인 보호막
+        edge_color  = lighten(COL_MINE, 35)
+
+    # 덮인 타일(회색 금속)
+    elif state == C_COVERED:
+        base_color  = COL_COVERED
+        inner_color = lighten(COL_COVERED, 10)
+        edge_color  = darken(COL_COVERED, 18)
+
+    # 안전 타일(REVEALED & not mine)
+    elif state == C_REVEALED:
+        # 톤다운된 푸른-회색
+        safe_base  = (70, 100, 125)
+        safe_inner = (90, 130, 160)
+        base_color  = safe_base
+        inner_color = safe_inner
+        edge_color  = lighten(safe_inner, 25)
+
+    else:
+        # 예비
+        base_color  = COL_COVERED
+        inner_color = lighten(COL_COVERED, 10)
+        edge_color  = darken(COL_COVERED, 18)
+
+    return base_color, inner_color, edge_color
+
+def highlight_scratch_size(size):
+    """paint_tile_body에 넘길 하이라이트 임시 서피스 크기 (어떤 타일의 bbox보다도 크게)."""
+    lw = max(1, size // 5)
+    return (size + 2 * lw + 6, 2 * lw + 6)
+
+def paint_tile_body(surface, state, x, y, size, highlight=None):
+    """
+    바탕 / 안쪽 / 테두리 폴리곤 + 윗변 하이라이트.
+    highlight: 여러 타일이 돌려 쓸 임시 서피스 (highlight_scratch_size 이상). 없으면 새로 빌림.
+    """
+    outer_corners = hex_corners((x, y), size - 1)
+    inner_corners = hex_corners((x, y), size - 5)
+    base_color, inner_color, edge_color = tile_colors(state)
+
+    # -------- LAYER DRAW ----------
+    pygame.draw.polygon(surface, base_color, outer_corners)
+    pygame.draw.polygon(surface, inner_color, inner_corners)
+    pygame.draw.polygon(surface, edge_color, outer_corners, width=2)
+
+    # -------- TOP HIGHLIGHT (살짝만) ----------
+    # (윗변 주변 bbox 크기의 임시 서피스에만 그림)
+    highlight_color = (255, 255, 255, 40)
+    line_w = max(1, size//5)
+    top_pts = sorted(outer_corners, key=lambda p: p[1])[:2]
+    hx0 = int(min(top_pts[0][0], top_pts[1][0])) - line_w - 1
+    hy0 = int(min(top_pts[0][1], top_pts[1][1])) - line_w - 1
+    hx1 = int(max(top_pts[0][0], top_pts[1][0])) + line_w + 2
+    hy1 = int(max(top_pts[0][1], top_pts[1][1])) + line_w + 2
+    area = pygame.Rect(0, 0, hx1 - hx0, hy1 - hy0)
+    if highlight is None:
+        highlight_surf = surfaces.scratch(area.size)
+    else:
+        highlight_surf = highlight
+        highlight_surf.fill((0, 0, 0, 0), area)
+    pygame.draw.line(
+        highlight_surf, highlight_color,
+        (top_pts[0][0] - hx0, top_pts[0][1] - hy0),
+        (top_pts[1][0] - hx0, top_pts[1][1] - hy0),
+        width=line_w
+    )
+    surface.blit(highlight_surf, (hx0, hy0), area)
 
-        # --- 라벨 위치 계산 (공통 함수 사용) ---
-        px, py = edge_label_center(board, ent, center, size)
+# (state, hex_size) → (스탬프, 중심에서 topleft까지 오프셋)
+# 상태 4종 x 크기 몇 개뿐이지만, 줌을 계속 바꿔도 무한히 쌓이지 않게
+_tile_stamps = surfaces.BoundedCache(64)
 
-        # --- 회전 각도 ---
-        custom_angle = ent.get("label_angle", None)
-        if isinstance(custom_angle, (int, float)):
-            angle_deg = float(custom_angle)
+def tile_stamp(state, size):
+    """
+    작은 hex 크기용 타일 스탬프. 정수 중심에 한 번 그려 두고 반올림한 위치에 blit한다.
+    (부동소수 중심과 0.5px 미만 차이)
+    LOD_MIN_TEXT_SIZE 미만이면 단색 hex 하나만 굽는다.
+    """
+    key = (state, size)
+    entry = _tile_stamps.get(key)
+    if entry is None:
+        off = size + size // 5 + 3
+        stamp = surfaces.new_surface((off * 2 + 1, off * 2 + 1))
+        if size < LOD_MIN_TEXT_SIZE:
+            _base, inner_color, _edge = tile_colors(state)
+            pygame.draw.polygon(stamp, inner_color, hex_corners((off, off), size - 1))
         else:
-            # 회전 기준 벡터는 dir(보드 안쪽) — 숫자가 '지뢰가 있는 열'을 바라봄
-            rot_dx, rot_dy = dir_pixel(size, d)
-            angle_deg = math.degrees(math.atan2(-rot_dy, rot_dx))
-            if angle_deg > 90:
-                angle_deg -= 180
-            elif angle_deg < -90:
-                angle_deg += 180
+            paint_tile_body(stamp, state, off, off, size)
+        entry = (stamp, off)
+        _tile_stamps[key] = entry
+    return entry
+
+def tile_label(board, q, r, t):
+    """REVEALED 안전 타일의 숫자 문자열. 없으면 None."""
+    if t.state != C_REVEALED or t.is_mine:
+        return None
+    hint = board.number_hint.get((q, r))
+    if hint == "unknown":
+        return "?"
+    if t.number > 0:
+        if hint == "tight":
+            return f"{{{t.number}}}"
+        if hint == "loose":
+            return f"-{t.number}-"
+        return str(t.number)
+    return None
+
+# (label, font) → 렌더된 숫자
+_tile_label_cache = surfaces.BoundedCache(64)
+
+def tile_label_sprite(label, font):
+    key = (label, font)
+    txt = _tile_label_cache.get(key)
+    if txt is None:
+        txt = font.render(label, True, COL_TEXT)
+        _tile_label_cache[key] = txt
+    return txt
+
+def draw_tile(surface, board, q, r, t, x, y, size, font, highlight=None):
+    """(x, y)를 중심으로 타일 하나를 상태별 스타일로 그린다 (draw_board / 청크 굽기 공용)."""
+    # -------- BLOCKED ----------
+    if t.state == C_BLOCKED:
+        return
 
+    if size <= TILE_STAMP_MAX_SIZE:
+        # LOD: 구워 둔 스탬프 한 장
+        stamp, off = tile_stamp(t.state, size)
+        surface.blit(stamp, (round(x) - off, round(y) - off))
+        if size < LOD_MIN_TEXT_SIZE:
+            return
+    else:
+        paint_tile_body(surface, t.state, x, y, size, highlight)
+
+    # -------- 숫자 ----------
+    label = tile_label(board, q, r, t)
+    if label:
+        txt = tile_label_sprite(label, font)
+        surface.blit(txt, txt.get_rect(center=(x, y)))
+
+# 이 셀 수 이상인 보드는 청크 캐시로 그린다 (기본 스테이지는 전부 이보다 작음)
+CHUNK_MIN_CELLS = 2000
+
+_board_chunks = weakref.WeakKeyDictionary()
+
+def board_chunks(board):
+    """보드별 BoardChunks (보드가 바뀌면 같이 사라진다)."""
+    chunks = _board_chunks.get(board)
+    if chunks is None:
+        chunks = BoardChunks(board, draw_tile, highlight_scratch_size)
+        _board_chunks[board] = chunks
+    return chunks
+
+# (count, style, angle, dimmed, font) → 회전 + 알파까지 적용된 라벨
+_edge_label_cache = surfaces.BoundedCache(256)
+
+def edge_label_sprite(cnt, style, angle_deg, dimmed, font):
+    key = (cnt, style, angle_deg, dimmed, font)
+    rot = _edge_label_cache.get(key)
+    if rot is None:
+        # 라벨 문자열
+        label = f"{{{cnt}}}" if style == "tight" else (f"-{cnt}-" if style == "loose" else str(cnt))
+        img = font.render(label, True, COL_TEXT)
         rot = pygame.transform.rotate(img, angle_deg)
 
         # --- 흐리기(dimming) 처리 ---
-        if ent.get("dimmed"):
+        if dimmed:
             rot.set_alpha(80)   # 반투명
         else:
             rot.set_alpha(255)
 
+        _edge_label_cache[key] = rot
+    return rot
+
+def draw_edge_hints(surface, board, center, size, font):
+    if not hasattr(board, "edge_hints"):
+        return
+
+    layout = edge_hint_layout(board, size)
+    cx, cy = center
+
+    for i, ent in enumerate(board.edge_hints):
+        cnt = int(ent["count"])
+        style = ent["style"]
+
+        # --- 라벨 위치 / 회전 각도 (레이아웃 캐시) ---
+        px, py = layout.centers[i]
+        px += cx
+        py += cy
+        angle_deg = layout.angles[i]
+
+        # 렌더 + 회전 + 흐리기까지 끝난 라벨을 캐시에서 꺼내 blit만
+        rot = edge_label_sprite(cnt, style, angle_deg, bool(ent.get("dimmed")), font)
         surface.blit(rot, rot.get_rect(center=(px, py)))
 
-        # --- 보조선(helper line) 표시 ---
+        # --- 보조선(helper line) 표시: 캐시된 로컬 스프라이트를 center만큼 옮겨서 ---
         if ent.get("helper_on"):
-            # board.line_cells 사용해서 해당 줄의 셀들 얻기
-            path = board.line_cells(ent["pos"][0], ent["pos"][1], d)
-            # 차단된 셀은 제외
-            path_play = [
-                (q, r) for (q, r) in path
-                if board.tiles[(q, r)].state != C_BLOCKED
-            ]
-            if len(path_play) >= 2:
-                overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-                pts = []
-                for (q, r) in path_play:
-                    x, y = axial_to_pixel(q, r, size)
-                    x += cx; y += cy
-                    pts.append((x, y))
-                # 반투명 흰색 보조선
-                pygame.draw.lines(overlay, (255, 255, 255, 120), False, pts, 3)
-                surface.blit(overlay, (0, 0))
+            helper = edge_helper_sprite(board, i, size)
+            if helper is not None:
+                sprite, (hx, hy) = helper
+                surface.blit(sprite, (hx + center[0], hy + center[1]))
 
-def draw_topright_info(surface, board, font, pad=12):
-    w, _ = surface.get_size()
-    s = f"남은 지뢰 {board.mines_left}   실수 {board.mistakes}"
-    img = font.render(s, True, COL_TEXT)
+# ---- HUD: (남은 지뢰, 실수, 화면 너비, ...) → 미리 구운 패널 ----
+_hud_cache = surfaces.BoundedCache(4)
+
+def _build_hud_panel(text, font):
+    img = font.render(text, True, COL_TEXT)
 
     # 패널 안쪽 여백
     inner_pad_x = 12
@@ -243,15 +458,12 @@ def draw_topright_info(surface, board, font, pad=12):
     panel_w = img.get_width() + inner_pad_x * 2
     panel_h = img.get_height() + inner_pad_y * 2
 
-    panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-    panel_rect.topright = (w - pad, pad)
-
     # 튜토리얼 / 클리어 모달과 비슷한 색감
     panel_bg   = (20, 26, 46)
     panel_edge = (110, 130, 190)
 
     # 약간 투명한 패널 서피스 위에 그리기
-    hud_surf = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+    hud_surf = surfaces.new_surface((panel_w, panel_h))
 
     # 배경 (살짝 투명)
     bg_color = (*panel_bg, 210)
@@ -274,30 +486,93 @@ def draw_topright_info(surface, board, font, pad=12):
     text_rect = img.get_rect()
     text_rect.topleft = (inner_pad_x, inner_pad_y)
     hud_surf.blit(img, text_rect)
+    return hud_surf
 
-    # 최종적으로 화면에 blit
+def draw_topright_info(surface, board, font, pad=12):
+    """
+    우측 상단 HUD. 패널은 남은 지뢰 / 실수 횟수 / 화면 너비가 바뀔 때만 다시 굽는다.
+    반환값: 이번에 HUD가 차지한 화면 영역 (damage rect)
+    """
+    w, _ = surface.get_size()
+    key = (board.mines_left, board.mistakes, w, pad, font)
+    entry = _hud_cache.get(key)
+    if entry is None:
+        hud_surf = _build_hud_panel(f"남은 지뢰 {board.mines_left}   실수 {board.mistakes}", font)
+        panel_rect = hud_surf.get_rect()
+        panel_rect.topright = (w - pad, pad)
+        entry = (hud_surf, panel_rect)
+        _hud_cache[key] = entry
+
+    hud_surf, panel_rect = entry
     surface.blit(hud_surf, panel_rect.topleft)
+    return panel_rect.copy()
+
+# ---- App.bus 구독: 화면 크기 / 스테이지에 묶인 캐시 비우기 ----
+def on_resolution_changed(size):
+    _overlay_cache.clear()
+    _modal_cache.clear()
+    _hud_cache.clear()
+
+def on_stage_loaded(**_):
+    # 이전 스테이지의 HUD 숫자 조합은 다시 쓸 일이 거의 없음
+    _hud_cache.clear()
+
+# ---- 모달: (입력 key) → 미리 구운 패널 + 버튼 rect 표 ----
+_modal_cache = surfaces.BoundedCache(8)
+_overlay_cache = surfaces.BoundedCache(4)
+
+def _dark_overlay(size, alpha):
+    """화면 크기의 반투명 검은 오버레이 (크기/알파별로 한 장)"""
+    key = (tuple(size), alpha)
+    surf = _overlay_cache.get(key)
+    if surf is None:
+        surf = surfaces.new_surface(size)
+        surf.fill((0, 0, 0, alpha))
+        _overlay_cache[key] = surf
+    return surf
+
+def draw_cached_modal(surface, key, panel_rect, build, overlay_alpha=180):
+    """
+    오버레이 + 패널을 blit 2번으로 그리고 화면 좌표 버튼 rect dict를 돌려준다.
 
-def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20, show_next: bool = True):
-    w, h = surface.get_size()
-
-    # 1) 어두운 오버레이 (튜토리얼 모달과 비슷한 톤)
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0, 0))
-
-    # 2) 중앙 패널
-    panel_w = int(min(560, w * 0.72))
-    panel_h = 310
-
-    panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-    panel_rect.center = (w // 2, h // 2)
+    - key        : 패널 내용을 결정하는 값들 (화면 크기, 라벨, 실수 횟수 등)
+    - panel_rect : 화면 좌표 패널 영역
+    - build(panel) : panel Surface(패널 크기, 로컬 좌표)에 그리고
+                     로컬 좌표 버튼 rect dict를 반환. key가 바뀔 때만 호출된다.
+    panel_rect가 None이면 오버레이만 그린다.
+    """
+    surface.blit(_dark_overlay(surface.get_size(), overlay_alpha), (0, 0))
+    if panel_rect is None:
+        return {}
+
+    key = (key, tuple(panel_rect))
+    entry = _modal_cache.get(key)
+    if entry is None:
+        panel = surfaces.new_surface(panel_rect.size)
+        local_rects = build(panel)
+        rects = {name: r.move(panel_rect.topleft) for name, r in local_rects.items()}
+        entry = (panel, rects)
+        _modal_cache[key] = entry
+
+    panel, rects = entry
+    surface.blit(panel, panel_rect.topleft)
+    return dict(rects)
+
+def _modal_button(surface, rect, label, font, bg_color, border_color, text_color=(234, 242, 255)):
+    pygame.draw.rect(surface, bg_color, rect, border_radius=14)
+    pygame.draw.rect(surface, border_color, rect, width=2, border_radius=14)
+    t = font.render(label, True, text_color)
+    surface.blit(t, t.get_rect(center=rect.center))
+    return rect
+
+def _build_success_panel(panel, stage_label, mistakes, font, show_next):
+    panel_rect = panel.get_rect()
 
     panel_bg   = (20, 26, 46)    # 튜토리얼 모달 패널 색과 비슷
     panel_edge = (110, 130, 190) # 파란 보더
 
-    pygame.draw.rect(surface, panel_bg, panel_rect, border_radius=18)
-    pygame.draw.rect(surface, panel_edge, panel_rect, width=2, border_radius=18)
+    pygame.draw.rect(panel, panel_bg, panel_rect, border_radius=18)
+    pygame.draw.rect(panel, panel_edge, panel_rect, width=2, border_radius=18)
 
     # 3) 텍스트 영역
     title_color = (234, 242, 255)
@@ -308,21 +583,21 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
     # 상단 타이틀
     title_font = font
     title = title_font.render("스테이지 클리어", True, title_color)
-    surface.blit(title, title.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(title, title.get_rect(midtop=(panel_rect.centerx, y)))
     y += title.get_height() + 10
 
     # Stage 라벨
     label_txt = font.render(f"Stage: {stage_label}", True, title_color)
-    surface.blit(label_txt, label_txt.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(label_txt, label_txt.get_rect(midtop=(panel_rect.centerx, y)))
     y += label_txt.get_height() + 6
 
     # 설명 + 실수 정보
     msg = font.render("성공! 클리어를 축하합니다.", True, text_color)
-    surface.blit(msg, msg.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(msg, msg.get_rect(midtop=(panel_rect.centerx, y)))
     y += msg.get_height() + 4
 
     mist = font.render(f"실수 횟수: {mistakes}", True, text_color)
-    surface.blit(mist, mist.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(mist, mist.get_rect(midtop=(panel_rect.centerx, y)))
 
     star_count = calc_star_count(mistakes)
 
@@ -330,7 +605,7 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
 
     # 텍스트로 한 번 명시
     star_text = font.render(f"이번 판 별: {star_count} / 3", True, text_color)
-    surface.blit(star_text, star_text.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(star_text, star_text.get_rect(midtop=(panel_rect.centerx, y)))
     y += star_text.get_height() + 6
 
     # ★아이콘 3개 그리기 (획득한 별은 밝게, 나머지는 어둡게)
@@ -352,7 +627,7 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
     x = sx
     for img in star_imgs:
         rect = img.get_rect(midtop=(x + img.get_width() // 2, star_y))
-        surface.blit(img, rect)
+        panel.blit(img, rect)
         x += img.get_width() + star_gap
 
     # 4) 버튼들 (튜토리얼 모달 스타일의 둥근 버튼)
@@ -367,14 +642,6 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
     btn_y = panel_rect.bottom - 32 - btn_h
     start_x = panel_rect.centerx - total_w // 2
 
-    def button(x, y, label, bg_color, border_color, text_color=(234, 242, 255)):
-        r = pygame.Rect(x, y, btn_w, btn_h)
-        pygame.draw.rect(surface, bg_color, r, border_radius=14)
-        pygame.draw.rect(surface, border_color, r, width=2, border_radius=14)
-        t = font.render(label, True, text_color)
-        surface.blit(t, t.get_rect(center=r.center))
-        return r
-
     rects = {}
 
     # 색 계열 (튜토리얼 모달 버튼 느낌)
@@ -384,18 +651,18 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
     btn_main_edge = (150, 170, 230)
 
     # 왼쪽: 재시도 (파란 톤)
-    rects["retry"] = button(
-        start_x, btn_y,
-        "재시도",
+    rects["retry"] = _modal_button(
+        panel, pygame.Rect(start_x, btn_y, btn_w, btn_h),
+        "재시도", font,
         bg_color=btn_main_bg,
         border_color=btn_main_edge,
     )
 
     # 가운데: 레벨 선택
     mid_x = start_x + btn_w + gap
-    rects["menu"] = button(
-        mid_x, btn_y,
-        "레벨 선택",
+    rects["menu"] = _modal_button(
+        panel, pygame.Rect(mid_x, btn_y, btn_w, btn_h),
+        "레벨 선택", font,
         bg_color=btn_dark_bg,
         border_color=btn_dark_edge,
     )
@@ -403,34 +670,41 @@ def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20
     # 오른쪽: 다음 스테이지 (옵션)
     if show_next:
         next_x = start_x + (btn_w + gap) * 2
-        rects["next"] = button(
-            next_x, btn_y,
-            "다음 스테이지",
+        rects["next"] = _modal_button(
+            panel, pygame.Rect(next_x, btn_y, btn_w, btn_h),
+            "다음 스테이지", font,
             bg_color=btn_main_bg,
             border_color=btn_main_edge,
         )
 
     return rects
 
-def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20, is_tutorial=False):
+def draw_success_modal(surface, stage_label: str, mistakes: int, font, *, pad=20, show_next: bool = True):
     w, h = surface.get_size()
 
-    # 1) 어두운 오버레이
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0, 0))
-
-    # 2) 중앙 패널 (튜토리얼 모달과 동일한 계열)
+    # 중앙 패널
     panel_w = int(min(560, w * 0.72))
-    panel_h = 260
+    panel_h = 310
+
     panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
     panel_rect.center = (w // 2, h // 2)
 
+    # 패널 내용은 (라벨, 실수 횟수, 다음 버튼 여부)가 바뀔 때만 다시 굽는다
+    return draw_cached_modal(
+        surface,
+        ("success", stage_label, mistakes, show_next, font),
+        panel_rect,
+        lambda panel: _build_success_panel(panel, stage_label, mistakes, font, show_next),
+    )
+
+def _build_pause_panel(panel, stage_label, mistakes, font, is_tutorial):
+    panel_rect = panel.get_rect()
+
     panel_bg   = (20, 26, 46)
     panel_edge = (110, 130, 190)
 
-    pygame.draw.rect(surface, panel_bg, panel_rect, border_radius=18)
-    pygame.draw.rect(surface, panel_edge, panel_rect, width=2, border_radius=18)
+    pygame.draw.rect(panel, panel_bg, panel_rect, border_radius=18)
+    pygame.draw.rect(panel, panel_edge, panel_rect, width=2, border_radius=18)
 
     # 3) 텍스트
     title_color = (234, 242, 255)
@@ -439,19 +713,19 @@ def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20,
     y = panel_rect.top + 26
 
     title = font.render("일시정지", True, title_color)
-    surface.blit(title, title.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(title, title.get_rect(midtop=(panel_rect.centerx, y)))
     y += title.get_height() + 10
 
     stage_txt = font.render(f"Stage: {stage_label}", True, title_color)
-    surface.blit(stage_txt, stage_txt.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(stage_txt, stage_txt.get_rect(midtop=(panel_rect.centerx, y)))
     y += stage_txt.get_height() + 6
 
     mist = font.render(f"현재 실수 횟수: {mistakes}", True, text_color)
-    surface.blit(mist, mist.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(mist, mist.get_rect(midtop=(panel_rect.centerx, y)))
     y += mist.get_height() + 6
 
     hint = font.render("ESC 또는 '계속하기'를 눌러 게임을 재개할 수 있습니다.", True, text_color)
-    surface.blit(hint, hint.get_rect(midtop=(panel_rect.centerx, y)))
+    panel.blit(hint, hint.get_rect(midtop=(panel_rect.centerx, y)))
 
     # 4) 버튼 3개 (튜토리얼 모달 스타일)
     btn_w, btn_h = 140, 44
@@ -460,14 +734,6 @@ def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20,
     btn_y = panel_rect.bottom - 32 - btn_h
     start_x = panel_rect.centerx - total_w // 2
 
-    def button(x, y, label, bg_color, border_color, text_color=(234, 242, 255)):
-        r = pygame.Rect(x, y, btn_w, btn_h)
-        pygame.draw.rect(surface, bg_color, r, border_radius=14)
-        pygame.draw.rect(surface, border_color, r, width=2, border_radius=14)
-        t = font.render(label, True, text_color)
-        surface.blit(t, t.get_rect(center=r.center))
-        return r
-
     rects = {}
 
     # 색 계열
@@ -479,9 +745,9 @@ def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20,
     btn_reset_edge  = (200, 120, 120)
 
     # 왼쪽: 계속하기
-    rects["resume"] = button(
-        start_x, btn_y,
-        "계속하기",
+    rects["resume"] = _modal_button(
+        panel, pygame.Rect(start_x, btn_y, btn_w, btn_h),
+        "계속하기", font,
         bg_color=btn_resume_bg,
         border_color=btn_resume_edge,
     )
@@ -489,34 +755,52 @@ def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20,
     # 가운데: 레벨 선택 / 타이틀 화면으로
     mid_label = "타이틀 화면으로" if is_tutorial else "레벨 선택"
     mid_x = start_x + btn_w + gap
-    rects["level"] = button(
-        mid_x, btn_y,
-        mid_label,
+    rects["level"] = _modal_button(
+        panel, pygame.Rect(mid_x, btn_y, btn_w, btn_h),
+        mid_label, font,
         bg_color=btn_mid_bg,
         border_color=btn_mid_edge,
     )
 
     # 오른쪽: 초기화
     right_x = start_x + (btn_w + gap) * 2
-    rects["restart"] = button(
-        right_x, btn_y,
-        "초기화",
+    rects["restart"] = _modal_button(
+        panel, pygame.Rect(right_x, btn_y, btn_w, btn_h),
+        "초기화", font,
         bg_color=btn_reset_bg,
         border_color=btn_reset_edge,
     )
 
     return rects
 
+def draw_pause_modal(surface, stage_label: str, mistakes: int, font, *, pad=20, is_tutorial=False):
+    w, h = surface.get_size()
+
+    # 중앙 패널 (튜토리얼 모달과 동일한 계열)
+    panel_w = int(min(560, w * 0.72))
+    panel_h = 260
+    panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
+    panel_rect.center = (w // 2, h // 2)
+
+    return draw_cached_modal(
+        surface,
+        ("pause", stage_label, mistakes, is_tutorial, font),
+        panel_rect,
+        lambda panel: _build_pause_panel(panel, stage_label, mistakes, font, is_tutorial),
+    )
+
+# ---- 히트맵용: 테두리 숫자 라벨의 (중심 x, 중심 y, 반지름) 목록 ----
+def edge_label_discs(board, center, size, radius=20):
+    if not hasattr(board, "edge_hints"):
+        return []
+    layout = edge_hint_layout(board, size, radius)
+    cx, cy = center
+    return [(px + cx, py + cy, r) for (px, py), r in zip(layout.centers, layout.radii)]
+
 # ---- 새로 추가: 테두리 숫자 히트 테스트 ----
 def edge_hint_hit_test(board, center, size, mouse_pos, radius=20):
     if not hasattr(board, "edge_hints"):
         return None
 
-    mx, my = mouse_pos
-    for idx, ent in enumerate(board.edge_hints):
-        px, py = edge_label_center(board, ent, center, size)
-        dx = mx - px
-        dy = my - py
-        if dx*dx + dy*dy <= radius*radius:
-            return idx
-    return None
\ No newline at end of file
+    local = (mouse_pos[0] - center[0], mouse_pos[1] - center[1])
+    return edge_hint_layout(board, size, radius).hit_test(local)
\ No newline at end of file
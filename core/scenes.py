@@ -1,19 +1,21 @@
 # core/scenes.py
 import os, json, re, math
 import pygame
-from core.ui import Button, draw_label_center, Slider
+from core.ui import Button, draw_label_center, Slider, WidgetGroup
 from core import render as render_mod
 from core.board import Board, C_REVEALED, C_BLOCKED
 from core.grid import HexGrid, cube_len
-from core.hexmath import pixel_to_axial, hex_corners, axial_to_pixel
+from core.hexmath import hex_corners, axial_to_pixel
+from core.hitmap import HexHitMap
+from core.camera import Camera
+from core import surfaces
+from core import bus
 from settings import COL_FLAG_TILE, COL_COVERED, HEX_SIZE
 
-from animations.title_space import TitleBackground
 from animations.tile_reveal import TileRevealAnim, draw_reveal_anims
 from animations.tile_mistake import TileShakeAnim, draw_shake_anims
 from animations.tile_hover import TileHoverAnim, draw_hover_anim
 from animations.stage_star_glow import draw_stage_star_glow
-from animations.game_hex_bg import GameHexBackground
 
 TOTAL_STAGES = 37
 MAJOR_STEP_LAST_INDICES = {1, 7, 19, 37}
@@ -60,10 +62,64 @@ def stage_difficulty_index(idx: int) -> int:
         return 3
 
 
+# 튜토리얼 이미지: 페이지를 처음 보여줄 때 로드하고, 패널 크기별 축소본을 캐시
+_tutorial_images = {}    # 경로 → 원본 Surface
+_tutorial_scaled = surfaces.BoundedCache(8)    # (경로, 최대 크기) → 화면에 그릴 Surface
+
+def tutorial_page_image(path, max_size):
+    """path 이미지를 max_size 안에 들어가게 (확대는 하지 않음) 줄인 Surface."""
+    key = (path, tuple(max_size))
+    img_disp = _tutorial_scaled.get(key)
+    if img_disp is not None:
+        return img_disp
+
+    img = _tutorial_images.get(path)
+    if img is None:
+        img = pygame.image.load(path).convert_alpha()
+        _tutorial_images[path] = img
+
+    iw, ih = img.get_size()
+    max_iw, max_ih = max_size
+    scale = min(max_iw / iw, max_ih / ih, 1.0)
+    if scale < 1.0:
+        img_disp = pygame.transform.smoothscale(img, (int(iw * scale), int(ih * scale)))
+    else:
+        img_disp = img
+
+    _tutorial_scaled[key] = img_disp
+    return img_disp
+
+
 # 공통 Scene 인터페이스
 class Scene:
     def __init__(self, game):
         self.game = game
+        self._subscriptions = []
+        # 이번 프레임에 바뀐 화면 영역 목록 (App.present가 그 부분만 내보냄).
+        # None이면 화면 전체를 내보낸다.
+        self.damage = None
+
+    def subscribe(self, topic, callback):
+        """App.bus 구독. on_exit()에서 한꺼번에 해제된다."""
+        self.game.bus.subscribe(topic, callback)
+        self._subscriptions.append((topic, callback))
+
+    def on_exit(self):
+        """
+        App.change_scene이 이 씬을 내보낼 때 부른다.
+        버튼 on_click 같은 순환 참조 때문에 씬이 GC 전까지 살아 있으므로,
+        약한 참조에만 기대지 않고 구독을 직접 끊는다.
+        """
+        for topic, callback in self._subscriptions:
+            self.game.bus.unsubscribe(topic, callback)
+        self._subscriptions.clear()
+
+    def invalidate(self):
+        """
+        화면 내용이 이 씬이 그린 그대로가 아닐 때 App이 부른다 (씬 진입 / 전환 직후).
+        damage만 내보내는 씬은 다음 draw()에서 화면 전체를 다시 그려야 한다.
+        """
+
     def handle_event(self, e): pass
     def update(self, dt): pass
     def draw(self, screen): pass
@@ -77,8 +133,8 @@ class TitleScene(Scene):
         self.ui_font = self.game.load_font(26)
         self.small_font = self.game.load_font(22)
 
-        # 배경 로드
-        self.bg = TitleBackground((W, H))
+        # 배경 로드 (씬끼리 공유)
+        self.bg = self.game.backgrounds.title((W, H))
 
         # 타이틀 이미지 로드
         logo_path = os.path.join(self.game.ASSET_DIR, "images", "game_title.png")
@@ -149,8 +205,14 @@ class TitleScene(Scene):
         self.quit_btn.fg = sub_fg
 
 
+        # 포인터 이벤트 / 배치는 위젯 그룹이 담당 (배치는 화면 크기별로 캐시)
+        self.widgets = WidgetGroup([self.start_btn, self.option_btn, self.credit_btn, self.quit_btn])
+        self.widgets.set_layout(self.layout_rects)
+
         self.last_size = None
         self.relayout(game.screen.get_size())
+        # 화면 크기가 바뀔 때만 재배치 (배경 크기는 BackgroundService가 맞춤)
+        self.subscribe(bus.RESOLUTION_CHANGED, self.relayout)
 
         # 처음 실행 시에만 메인 BGM 재생.
         # 이미 다른 BGM이 재생 중이면 건드리지 않는다.
@@ -158,21 +220,26 @@ class TitleScene(Scene):
             if hasattr(self.game, "play_bgm"):
                 self.game.play_bgm("main")
 
-    def relayout(self, size):
+    @staticmethod
+    def layout_rects(size):
+        """화면 크기 → [시작, 옵션, 크레딧, 종료] 버튼 rect"""
         W, H = size
-        self.last_size = size
         start_w, start_h = 260, 60
         start_x = (W - start_w) // 2
         start_y = int(H * 0.55)
-        self.start_btn.rect.update(start_x, start_y, start_w, start_h)
+        rects = [(start_x, start_y, start_w, start_h)]
 
         sub_w, sub_h = 200, 46
         sub_gap = 10
         sub_block_top = start_y + start_h + 24
         sub_x = (W - sub_w) // 2
-        self.option_btn.rect.update(sub_x, sub_block_top + 0 * (sub_h + sub_gap), sub_w, sub_h)
-        self.credit_btn.rect.update(sub_x, sub_block_top + 1 * (sub_h + sub_gap), sub_w, sub_h)
-        self.quit_btn.rect.update(sub_x, sub_block_top + 2 * (sub_h + sub_gap), sub_w, sub_h)
+        for i in range(3):
+            rects.append((sub_x, sub_block_top + i * (sub_h + sub_gap), sub_w, sub_h))
+        return rects
+
+    def relayout(self, size):
+        self.last_size = size
+        self.widgets.relayout(size)
 
     def go_level_select(self):
         # 아직 튜토리얼(1번 스테이지)만 열린 상태라면 → 바로 1번 스테이지 진입
@@ -194,38 +261,27 @@ class TitleScene(Scene):
         self.game.quit()
 
     def handle_event(self, e):
-        self.start_btn.handle_event(e)
-        self.option_btn.handle_event(e)
-        self.credit_btn.handle_event(e)
-        self.quit_btn.handle_event(e)
+        self.widgets.handle_event(e)
 
     def update(self, dt):
         if hasattr(self, "bg"):
             self.bg.update(dt)
 
     def draw(self, screen):
-        size = screen.get_size()
-        if size != self.last_size:
-            self.relayout(size)
-            if hasattr(self, "bg"):
-                self.bg.resize(size)
-
         if hasattr(self, "bg"):
             self.bg.draw(screen)
         else:
             screen.fill((14, 18, 32))
 
-        W, H = size
+        W, H = self.last_size
         # 타이틀 이미지 그리기
         img = self.title_img
         rect = img.get_rect()
         rect.center = (W // 2, int(H * 0.32))
         screen.blit(img, rect)
 
-        self.start_btn.draw(screen)
-        self.option_btn.draw(screen)
-        self.credit_btn.draw(screen)
-        self.quit_btn.draw(screen)
+        # 배경이 매 프레임 움직이므로 버튼은 전부 다시 그린다 (버튼당 blit 1번)
+        self.widgets.draw(screen)
 
 
 class OptionsScene(Scene):
@@ -303,6 +359,47 @@ class OptionsScene(Scene):
             on_click = self.open_reset_modal
         )
 
+        # 선택된 표시 모드는 살짝 밝게 (모드를 바꾸면 씬을 새로 만든다)
+        current_idx = getattr(self.game, "display_mode_index", 0)
+        for i, b in enumerate(self.res_buttons):
+            b.bg = (80, 96, 130) if i == current_idx else (40, 46, 60)
+
+        self.widgets = WidgetGroup(
+            [self.bgm_slider, self.sfx_slider]
+            + self.res_buttons
+            + [self.back_btn, self.reset_btn]
+        )
+
+        # 배경 + 제목/라벨은 정적이라 한 장에 구워 두고,
+        # 평소에는 바뀐 위젯 영역만 다시 그려서 damage로 내보낸다
+        self.static_layer = None
+        self.full_redraw = True
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def build_static_layer(self, size):
+        layer = surfaces.new_surface(size, alpha=False)
+        layer.fill((10, 14, 24))
+        W, H = size
+
+        # 제목
+        draw_label_center(layer, "옵션", self.title_font, (W//2, int(H*0.16)))
+
+        # 라벨 텍스트
+        bgm_label = self.ui_font.render("배경 음악 볼륨", True, (234,242,255))
+        sfx_label = self.ui_font.render("효과음 볼륨", True, (234,242,255))
+        res_label = self.ui_font.render("화면 모드", True, (234,242,255))
+
+        layer.blit(bgm_label, (self.bgm_slider.rect.left,
+                               self.bgm_slider.rect.top - 32))
+        layer.blit(sfx_label, (self.sfx_slider.rect.left,
+                               self.sfx_slider.rect.top - 32))
+
+        res_y = self.sfx_slider.rect.top + 80
+        layer.blit(res_label, (self.bgm_slider.rect.left, res_y - 36))
+        return layer
+
     def open_reset_modal(self):
         self.reset_modal_active = True
         self.reset_modal_btns = {}
@@ -361,35 +458,21 @@ class OptionsScene(Scene):
             self.back_to_title()
             return
 
-        self.back_btn.handle_event(e)
-        self.bgm_slider.handle_event(e)
-        self.sfx_slider.handle_event(e)
-        for b in self.res_buttons:
-            b.handle_event(e)
-        self.reset_btn.handle_event(e)
+        self.widgets.handle_event(e)
 
-    def draw_reset_modal(self, screen):
-        w, h = screen.get_size()
+    def build_reset_panel(self, panel):
+        panel_rect = panel.get_rect()
 
-        # 어두운 오버레이
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
-
-        panel_w, panel_h = 520, 220
-        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-        panel_rect.center = (w // 2, h // 2)
-
-        pygame.draw.rect(screen, (40, 46, 60), panel_rect, border_radius=16)
-        pygame.draw.rect(screen, (100, 110, 140), panel_rect, width=2, border_radius=16)
+        pygame.draw.rect(panel, (40, 46, 60), panel_rect, border_radius=16)
+        pygame.draw.rect(panel, (100, 110, 140), panel_rect, width=2, border_radius=16)
 
         y = panel_rect.top + 30
         title = self.ui_font.render("게임 데이터를 초기화할까요?", True, (234, 242, 255))
-        screen.blit(title, (panel_rect.left + 24, y))
+        panel.blit(title, (panel_rect.left + 24, y))
         y += title.get_height() + 12
 
         msg = self.small_font.render("모든 데이터가 삭제되고 게임이 초기화됩니다.", True, (200, 210, 230))
-        screen.blit(msg, (panel_rect.left + 24, y))
+        panel.blit(msg, (panel_rect.left + 24, y))
 
         btn_w, btn_h = 120, 40
         gap = 20
@@ -401,54 +484,49 @@ class OptionsScene(Scene):
         cancel_rect = pygame.Rect(start_x + btn_w + gap, btn_y, btn_w, btn_h)
 
         # 확인 버튼 (빨간 느낌)
-        pygame.draw.rect(screen, (160, 60, 60), ok_rect, border_radius=10)
+        pygame.draw.rect(panel, (160, 60, 60), ok_rect, border_radius=10)
         ok_txt = self.small_font.render("예, 초기화", True, (255, 255, 255))
-        screen.blit(ok_txt, ok_txt.get_rect(center=ok_rect.center))
+        panel.blit(ok_txt, ok_txt.get_rect(center=ok_rect.center))
 
         # 취소 버튼 (회색)
-        pygame.draw.rect(screen, (90, 96, 120), cancel_rect, border_radius=10)
+        pygame.draw.rect(panel, (90, 96, 120), cancel_rect, border_radius=10)
         cancel_txt = self.small_font.render("취소", True, (255, 255, 255))
-        screen.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
+        panel.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
 
         return {"ok": ok_rect, "cancel": cancel_rect}
 
-    def draw(self, screen):
-        screen.fill((10, 14, 24))
-        W, H = self.game.WIDTH, self.game.HEIGHT
-
-        # 제목
-        draw_label_center(screen, "옵션", self.title_font, (W//2, int(H*0.16)))
-
-        # 라벨 텍스트
-        bgm_label = self.ui_font.render("배경 음악 볼륨", True, (234,242,255))
-        sfx_label = self.ui_font.render("효과음 볼륨", True, (234,242,255))
-        res_label = self.ui_font.render("화면 모드", True, (234,242,255))
-
-        screen.blit(bgm_label, (self.bgm_slider.rect.left,
-                                self.bgm_slider.rect.top - 32))
-        screen.blit(sfx_label, (self.sfx_slider.rect.left,
-                                self.sfx_slider.rect.top - 32))
+    def draw_reset_modal(self, screen):
+        w, h = screen.get_size()
 
-        res_y = self.sfx_slider.rect.top + 80
-        screen.blit(res_label, (self.bgm_slider.rect.left, res_y - 36))
+        panel_w, panel_h = 520, 220
+        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
+        panel_rect.center = (w // 2, h // 2)
 
-        # 슬라이더/버튼 그리기
-        self.bgm_slider.draw(screen)
-        self.sfx_slider.draw(screen)
-        current_idx = getattr(self.game, "display_mode_index", 0)
-        for i, b in enumerate(self.res_buttons):
-            # 선택된 표시 모드는 살짝 밝게
-            if i == current_idx:
-                b.bg = (80, 96, 130)
-            else:
-                b.bg = (40, 46, 60)
-            b.draw(screen)
+        # 오버레이 + 미리 구운 패널 (blit 2번)
+        return render_mod.draw_cached_modal(
+            screen, ("reset", self.ui_font, self.small_font), panel_rect,
+            self.build_reset_panel, overlay_alpha=150,
+        )
 
+    def draw(self, screen):
+        size = screen.get_size()
+        if self.static_layer is None or self.static_layer.get_size() != size:
+            self.static_layer = self.build_static_layer(size)
+            self.full_redraw = True
+
+        # 모달이 떠 있는 동안(과 닫힌 직후 한 프레임)은 화면 전체를 다시 그린다
+        if self.full_redraw or self.reset_modal_active:
+            screen.blit(self.static_layer, (0, 0))
+            # 슬라이더/버튼 그리기
+            self.widgets.draw(screen)
+            if self.reset_modal_active:
+                self.reset_modal_btns = self.draw_reset_modal(screen)
+            self.full_redraw = self.reset_modal_active
+            self.damage = None
+            return
 
-        self.back_btn.draw(screen)
-        self.reset_btn.draw(screen)
-        if self.reset_modal_active:
-            self.reset_modal_btns = self.draw_reset_modal(screen)   
+        # 바뀐 위젯 영역만 배경 복구 + 다시 그리기
+        self.damage = self.widgets.draw(screen, full=False, background=self.static_layer)
 
 class CreditsScene(Scene):
     def __init__(self, game):
@@ -464,6 +542,7 @@ class CreditsScene(Scene):
             font=self.small_font,
             on_click=self.back_to_title,   # ← 이 메서드를 밑에 정의
         )
+        self.widgets = WidgetGroup([self.back_btn])
 
         # 임시 크레딧 텍스트
         self.lines = [
@@ -491,7 +570,7 @@ class CreditsScene(Scene):
         if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
             self.back_to_title()   # 언더바 없는 걸로 통일
             return
-        self.back_btn.handle_event(e)
+        self.widgets.handle_event(e)
 
     def draw(self, screen):
         screen.fill((12, 16, 26))
@@ -513,7 +592,7 @@ class CreditsScene(Scene):
             screen.blit(img, rect)
             y += img.get_height() + 4
 
-        self.back_btn.draw(screen)
+        self.widgets.draw(screen)
     
 
 # 2) 레벨 선택 (1~37) – 정면에서 본 정육각형 37칸
@@ -527,15 +606,17 @@ class LevelSelectScene(Scene):
         # 진행도: 1 ~ max_unlocked_stage-1 = 클리어, max_unlocked_stage = 현재까지 열린 최고 단계
         self.max_unlocked = getattr(self.game, "max_unlocked_stage", 1)
 
-        # 배경 (타이틀과 같은 우주 배경 재사용)
+        # 배경 (타이틀과 같은 우주 배경 인스턴스를 공유, 링만 끔)
         W, H = self.game.WIDTH, self.game.HEIGHT
-        self.bg = TitleBackground((W, H), show_hex=False)
+        self.bg = self.game.backgrounds.title((W, H))
 
         # 37칸 hex-grid 기반 스테이지 타일 정보
         self.stage_tiles = []   # 각 타일: {"idx", "poly", "center", "cleared", "locked", "ring"}
-        self.last_size = None
         self.glow_time = 0.0
 
+        # 정적 타일 필드 캐시 (진행도 / 화면 크기가 바뀔 때만 재생성)
+        self.tile_layer = None
+
         # 뒤로가기 버튼
         btn_w, btn_h = 100, 40
         pad = 20
@@ -545,10 +626,18 @@ class LevelSelectScene(Scene):
             font=self.ui_font,
             on_click=self.go_title
         )
+        self.widgets = WidgetGroup([self.back_btn])
 
         # 최초 레이아웃
         self.build_layout(W, H)
 
+        # 화면 크기 / 진행도가 바뀌면 타일 레이어를 다음 draw에서 다시 굽는다
+        self.subscribe(bus.RESOLUTION_CHANGED, self.invalidate_tile_layer)
+        self.subscribe(bus.PROGRESS_CHANGED, self.invalidate_tile_layer)
+
+    def invalidate_tile_layer(self, **_):
+        self.tile_layer = None
+
 
     # --- 헥사 타일 내부 폴리곤 (안쪽 보호막/판) ---
     def _inner_poly(self, center, poly, scale=0.80):
@@ -577,7 +666,6 @@ class LevelSelectScene(Scene):
     # --- 37칸 정육각형 그리드 레이아웃 구성 ---
     def build_layout(self, W, H):
         self.stage_tiles.clear()
-        self.last_size = (W, H)
 
         cx = W // 2
         cy = H // 2 + 20  # 화면 중앙보다 아주 약간 아래
@@ -644,6 +732,7 @@ class LevelSelectScene(Scene):
         back_w, back_h = 100, 40
         pad = 20
         self.back_btn.rect.update(pad, pad, back_w, back_h)
+        self.widgets.rebuild_index()
 
     def get_stage_stars(self, idx: int) -> int:
         """저장된 최고 별 개수를 0~3 범위로 돌려준다."""
@@ -680,7 +769,7 @@ class LevelSelectScene(Scene):
     # --- 입력 처리 ---
     def handle_event(self, e):
         # 뒤로가기 버튼부터
-        self.back_btn.handle_event(e)
+        self.widgets.handle_event(e)
 
         if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
             mx, my = e.pos
@@ -699,17 +788,12 @@ class LevelSelectScene(Scene):
         self.glow_time += dt
 
 
-    def draw(self, screen):
-        size = screen.get_size()
-        if size != self.last_size:
-            self.build_layout(*size)
-
-        W, H = size
-        # 우주 배경 그리기
-        if hasattr(self, "bg"):
-            self.bg.draw(screen)
-        else:
-            screen.fill((12, 16, 26))
+    def build_tile_layer(self, size):
+        """
+        스테이지 타일 전체(halo + 육각형 + 하이라이트 + 번호)를 한 장의 레이어로 굽는다.
+        진행도(max_unlocked_stage / stage_best_stars)나 화면 크기가 바뀔 때만 다시 만든다.
+        """
+        layer = surfaces.new_surface(size)
 
         # 진행도 기준
         max_u = self.max_unlocked
@@ -767,41 +851,67 @@ class LevelSelectScene(Scene):
             r_est = max(((vx - cx) ** 2 + (vy - cy) ** 2) ** 0.5 for (vx, vy) in poly)
             halo_poly = hex_corners((cx, cy), r_est + 4)
 
-            halo_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            pygame.draw.polygon(halo_surf, (*outer, 40), halo_poly)
-            screen.blit(halo_surf, (0, 0))
+            # 타일 주변 bbox 크기의 작은 서피스에 그려서 레이어에 알파 블렌딩
+            hx0 = int(min(x for x, _ in halo_poly)) - 1
+            hy0 = int(min(y for _, y in halo_poly)) - 1
+            hx1 = int(max(x for x, _ in halo_poly)) + 2
+            hy1 = int(max(y for _, y in halo_poly)) + 2
+            halo_surf = surfaces.scratch((hx1 - hx0, hy1 - hy0))
+            pygame.draw.polygon(halo_surf, (*outer, 40),
+                                [(x - hx0, y - hy0) for (x, y) in halo_poly])
+            layer.blit(halo_surf, (hx0, hy0))
 
             # ---- 메인 육각형(outer + inner + border) ----
-            pygame.draw.polygon(screen, outer, poly)
+            pygame.draw.polygon(layer, outer, poly)
 
             inner_poly = self._inner_poly((cx, cy), poly, scale=0.80)
-            pygame.draw.polygon(screen, inner, inner_poly)
+            pygame.draw.polygon(layer, inner, inner_poly)
 
-            pygame.draw.polygon(screen, border, poly, width=2)
+            pygame.draw.polygon(layer, border, poly, width=2)
 
             # ---- 위쪽 하이라이트 ----
-            hi_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            hi_surf = surfaces.scratch((hx1 - hx0, hy1 - hy0))
             top_two = sorted(poly, key=lambda p: p[1])[:2]
             pygame.draw.line(
                 hi_surf,
                 (255, 255, 255, 35),
-                top_two[0],
-                top_two[1],
+                (top_two[0][0] - hx0, top_two[0][1] - hy0),
+                (top_two[1][0] - hx0, top_two[1][1] - hy0),
                 width=2,
             )
-            screen.blit(hi_surf, (0, 0))
+            layer.blit(hi_surf, (hx0, hy0))
 
             # ---- 스테이지 번호 ----
             label = f"{idx:02d}"
             txt = self.ui_font.render(label, True, text_color)
-            screen.blit(txt, txt.get_rect(center=(cx, cy)))
+            layer.blit(txt, txt.get_rect(center=(cx, cy)))
+
+        self.tile_layer = layer
+
+    def draw(self, screen):
+        if self.tile_layer is None:
+            # 진행도가 바뀌었으면(초기화 등) 잠금/별 상태도 다시 읽는다
+            size = screen.get_size()
+            self.max_unlocked = getattr(self.game, "max_unlocked_stage", 1)
+            self.build_layout(*size)
+            self.build_tile_layer(size)
+
+        # 우주 배경 그리기
+        if hasattr(self, "bg"):
+            self.bg.draw(screen, show_hex=False)
+        else:
+            screen.fill((12, 16, 26))
 
-            # 별 3개 스테이지에만 펄스 하이라이트
+        # 정적인 타일 필드는 캐시된 레이어 한 장
+        screen.blit(self.tile_layer, (0, 0))
+
+        # 별 3개 스테이지에만 펄스 하이라이트 (매 프레임 합성)
+        for tile in self.stage_tiles:
             if tile.get("stars", 0) >= 3:
-                draw_stage_star_glow(screen, (cx, cy), poly, self.glow_time)
+                draw_stage_star_glow(screen, tile["center"], tile["poly"], self.glow_time)
 
         # 뒤로가기 버튼
-        self.back_btn.draw(screen)
+        self.widgets.draw(screen)
 
 
 # 3) 게임 플레이 래퍼: 기존 보드/렌더 사용
@@ -810,9 +920,11 @@ class GameplayScene(Scene):
         super().__init__(game)
         self.stage_path = stage_path
         self.font = self.game.load_font(20)
+        # 마지막 프레임에 HUD가 차지한 화면 영역 (부분 갱신용 damage rect)
+        self.hud_rect = None
 
         W, H = self.game.WIDTH, self.game.HEIGHT
-        self.bg = GameHexBackground((W, H))
+        self.bg = self.game.backgrounds.game_hex((W, H))
 
         self.board, self.stage, self.hex_size = self.reload_board(stage_path)
         self.stage_label = self.stage_label_from(self.stage, stage_path)
@@ -862,6 +974,13 @@ class GameplayScene(Scene):
 
         self.hover_anim = None          # TileHoverAnim 인스턴스
         self.hover_tile = None          # (q, r) 또는 None
+
+        # 픽셀 → 타일/라벨 히트맵 (보드 로컬 좌표, 보드 / 카메라 hex 크기가 바뀌면 재생성)
+        self._hit_map = None
+
+        # 카메라 드래그(가운데 버튼) 상태 / 마지막 마우스 위치 (휠 확대 기준점)
+        self.panning = False
+        self.mouse_pos = (self.game.WIDTH // 2, self.game.HEIGHT // 2)
         
     # ----- 유틸 -----
     def load_stage(self, path):
@@ -897,9 +1016,89 @@ class GameplayScene(Scene):
         self.mistake_anims = []
         # 한 번 흔들리는 전체 시간(초)
         self.mistake_anim_duration = 0.25
-        # 흔들림 세기(픽셀) – 기본값은 타일 크기에 비례
-        self.mistake_anim_amplitude = self.hex_size * 0.14
+        # 흔들림 세기 – 흔들 때의 카메라 hex 크기에 곱하는 비율 (줌과 같이 커지고 작아짐)
+        self.mistake_anim_amplitude_ratio = 0.14
         
+    # 이보다 셀이 많은 보드는 히트맵을 만들지 않고 좌표 변환으로 바로 찾는다
+    # (줌 단계마다 다시 만들면 반지름 50 보드에서 수백 ms 걸림)
+    HIT_MAP_MAX_CELLS = 3000
+
+    def screen_size(self):
+        """카메라 변환에 넘기는 화면(논리 해상도) 크기."""
+        return (self.game.WIDTH, self.game.HEIGHT)
+
+    def hit_map(self):
+        """
+        보드 (0, 0) 기준 로컬 좌표의 HexHitMap. key가 같으면 그대로 재사용.
+        화면 중심은 정수이므로 카메라 이동은 질의 좌표만 옮기면 된다.
+        큰 보드는 None (tile_at / edge_hint_at이 직접 계산).
+        """
+        if len(self.board.tiles) > self.HIT_MAP_MAX_CELLS:
+            return None
+        size = self.camera.size
+        key = (self.board, size)
+        hm = self._hit_map
+        if hm is None or hm.key != key:
+            hm = HexHitMap(
+                self.board.tiles, (0, 0), size,
+                labels=render_mod.edge_label_discs(self.board, (0, 0), size),
+                key=key,
+            )
+            self._hit_map = hm
+        return hm
+
+    def tile_at(self, pos):
+        """화면 좌표 아래의 보드 타일 (q, r). 보드 밖이면 None."""
+        hm = self.hit_map()
+        if hm is not None:
+            return hm.tile_at(*self.camera.to_local(pos[0], pos[1], self.screen_size()))
+        q, r = self.camera.to_axial(pos[0], pos[1], self.screen_size())
+        return (q, r) if (q, r) in self.board.tiles else None
+
+    def edge_hint_at(self, pos):
+        """화면 좌표 아래의 테두리 숫자 인덱스. 없으면 None."""
+        hm = self.hit_map()
+        if hm is not None:
+            return hm.edge_hint_at(*self.camera.to_local(pos[0], pos[1], self.screen_size()))
+        center = self.camera.center(self.screen_size())
+        return render_mod.edge_hint_hit_test(self.board, center, self.camera.size, pos)
+
+    def handle_camera_event(self, e):
+        """
+        휠: 커서 위치 기준 확대/축소, 가운데 버튼 드래그: 이동, Home: 처음 시점.
+        카메라가 처리한 이벤트면 True (보드 클릭 / 호버로 넘기지 않음).
+        """
+        if e.type == pygame.MOUSEWHEEL:
+            if e.y:
+                self.camera.zoom_at(e.y, self.mouse_pos, self.screen_size())
+            return True
+
+        if e.type == pygame.MOUSEBUTTONDOWN and e.button in (2, 4, 5):
+            # 4/5는 pygame이 휠과 함께 보내는 버튼 이벤트 → MOUSEWHEEL에서 처리
+            if e.button == 2:
+                self.panning = True
+                self.mouse_pos = e.pos
+            return True
+
+        if e.type == pygame.MOUSEBUTTONUP and e.button in (2, 4, 5):
+            if e.button == 2:
+                self.panning = False
+            return True
+
+        if e.type == pygame.MOUSEMOTION:
+            last = self.mouse_pos
+            self.mouse_pos = e.pos
+            if self.panning:
+                self.camera.pan_by(e.pos[0] - last[0], e.pos[1] - last[1])
+                return True
+            return False
+
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_HOME:
+            self.camera.reset()
+            return True
+
+        return False
+
     def reload_board(self, path):
         st = self.load_stage(path)
         grid = HexGrid.from_stage(st)
@@ -909,6 +1108,10 @@ class GameplayScene(Scene):
         hex_size = st.get("hex_size") or st.get("tile_size") or HEX_SIZE
         hex_size = int(hex_size)
 
+        # 새 보드는 스테이지 hex_size, 화면 중앙에서 시작
+        self.camera = Camera(hex_size)
+
+        self.game.bus.publish(bus.STAGE_LOADED, path=path, board=board, hex_size=hex_size)
         return board, st, hex_size
     
     def open_pause_modal(self):
@@ -917,6 +1120,21 @@ class GameplayScene(Scene):
             return
         self.pause_active = True
 
+    def undo_move(self):
+        """보드 저널에서 한 수 되돌리기 (바뀐 칸만 복원)."""
+        if self.board.undo() is None:
+            return
+        self.reveal_anims.clear()
+        self.mistake_anims.clear()
+        self.hover_anim = None
+        self.hover_tile = None
+
+    def redo_move(self):
+        if self.board.redo() is None:
+            return
+        self.hover_anim = None
+        self.hover_tile = None
+
     def stage_label_from(self, st, path):
         if isinstance(st, dict) and "name" in st:
             return st["name"]
@@ -945,43 +1163,29 @@ class GameplayScene(Scene):
             self.game.unlock_stage(idx, TOTAL_STAGES, star_count=star_count)
 
     def load_tutorial_images(self):
-        """assets/images/tutorial/tuto_01~04.png 로부터 튜토리얼 이미지 로드."""
+        """
+        assets/images/tutorial/tuto_01~04.png 경로 목록만 모아 둔다.
+        실제 이미지는 해당 페이지를 처음 그릴 때 tutorial_page_image()가 로드한다.
+        """
         base = os.path.join(self.game.ASSET_DIR, "images", "tutorial")
         pages = []
         for i in range(1, 5):
             fname = f"tuto_{i:02d}.png"
             fpath = os.path.join(base, fname)
             if os.path.exists(fpath):
-                img = pygame.image.load(fpath).convert_alpha()
-                pages.append(img)
+                pages.append(fpath)
         self.tutorial_pages = pages
         self.tutorial_index = 0
         self.tutorial_btn_rects = {}
 
-    def draw_tutorial_modal(self, screen):
-        """튜토리얼 페이지를 화면 중앙에 띄우고, 버튼 rect들을 반환."""
-        w, h = screen.get_size()
+    def build_tutorial_panel(self, panel):
+        """현재 튜토리얼 페이지 패널을 panel(로컬 좌표)에 그리고 버튼 rect들을 반환."""
         btn_rects = {}
+        panel_rect = panel.get_rect()
+        panel_w, panel_h = panel_rect.size
 
-        # 어두운 오버레이
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
-
-        if not self.tutorial_pages:
-            return btn_rects
-
-        panel_w = int(w * 0.75)
-        panel_h = int(h * 0.75)
-        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-        panel_rect.center = (w // 2, h // 2)
-
-        pygame.draw.rect(screen, (20, 26, 46), panel_rect, border_radius=18)
-        pygame.draw.rect(screen, (110, 130, 190), panel_rect, width=2, border_radius=18)
-
-        # 현재 페이지 이미지
-        img = self.tutorial_pages[self.tutorial_index]
-        iw, ih = img.get_size()
+        pygame.draw.rect(panel, (20, 26, 46), panel_rect, border_radius=18)
+        pygame.draw.rect(panel, (110, 130, 190), panel_rect, width=2, border_radius=18)
 
         # 위쪽: 건너뛰기 텍스트용 여백 + 약간의 공간
         top_margin = 72  # 기존 32보다 훨씬 아래에서 시작
@@ -991,19 +1195,17 @@ class GameplayScene(Scene):
 
         max_iw = panel_w - 60
         max_ih = panel_h - (top_margin + bottom_reserved)
-        scale = min(max_iw / iw, max_ih / ih, 1.0)
-        if scale < 1.0:
-            img_disp = pygame.transform.smoothscale(img, (int(iw * scale), int(ih * scale)))
-        else:
-            img_disp = img
+
+        # 현재 페이지 이미지 (처음 볼 때만 로드 / 패널 크기별 축소본 재사용)
+        img_disp = tutorial_page_image(self.tutorial_pages[self.tutorial_index], (max_iw, max_ih))
         img_rect = img_disp.get_rect(midtop=(panel_rect.centerx, panel_rect.top + 32))
-        screen.blit(img_disp, img_rect)
+        panel.blit(img_disp, img_rect)
 
         # 페이지 표시
         page_text = f"{self.tutorial_index + 1} / {len(self.tutorial_pages)}"
         label = self.font.render(page_text, True, (220, 230, 245))
         label_rect = label.get_rect(midtop=(panel_rect.centerx, img_rect.bottom + 8))
-        screen.blit(label, label_rect)
+        panel.blit(label, label_rect)
 
         # 버튼들 (이전 / 다음 or 시작하기 / 건너뛰기)
         btn_w, btn_h = 120, 40
@@ -1014,20 +1216,20 @@ class GameplayScene(Scene):
         # 이전 버튼
         if self.tutorial_index > 0:
             prev_rect = pygame.Rect(center_x - btn_w - gap // 2, y, btn_w, btn_h)
-            pygame.draw.rect(screen, (40, 50, 96), prev_rect, border_radius=14)
-            pygame.draw.rect(screen, (120, 140, 210), prev_rect, width=2, border_radius=14)
+            pygame.draw.rect(panel, (40, 50, 96), prev_rect, border_radius=14)
+            pygame.draw.rect(panel, (120, 140, 210), prev_rect, width=2, border_radius=14)
             txt = self.font.render("이전", True, (234, 242, 255))
-            screen.blit(txt, txt.get_rect(center=prev_rect.center))
+            panel.blit(txt, txt.get_rect(center=prev_rect.center))
             btn_rects["prev"] = prev_rect
 
         # 다음 / 시작하기 버튼
         next_label = "다음" if self.tutorial_index < len(self.tutorial_pages) - 1 else "시작하기"
         next_rect = pygame.Rect(center_x + (0 if self.tutorial_index == 0 else gap // 2),
                                 y, btn_w, btn_h)
-        pygame.draw.rect(screen, (70, 92, 160), next_rect, border_radius=14)
-        pygame.draw.rect(screen, (150, 170, 230), next_rect, width=2, border_radius=14)
+        pygame.draw.rect(panel, (70, 92, 160), next_rect, border_radius=14)
+        pygame.draw.rect(panel, (150, 170, 230), next_rect, width=2, border_radius=14)
         txt = self.font.render(next_label, True, (240, 245, 255))
-        screen.blit(txt, txt.get_rect(center=next_rect.center))
+        panel.blit(txt, txt.get_rect(center=next_rect.center))
         btn_rects["next"] = next_rect
 
         # 우측 상단 건너뛰기 (선택)
@@ -1035,11 +1237,28 @@ class GameplayScene(Scene):
         skip_rect = skip_text.get_rect()
         pad = 18
         skip_rect.topright = (panel_rect.right - pad, panel_rect.top + pad)
-        screen.blit(skip_text, skip_rect)
+        panel.blit(skip_text, skip_rect)
         btn_rects["skip"] = skip_rect
 
         return btn_rects
 
+    def draw_tutorial_modal(self, screen):
+        """튜토리얼 페이지를 화면 중앙에 띄우고, 버튼 rect들을 반환."""
+        w, h = screen.get_size()
+
+        if not self.tutorial_pages:
+            # 어두운 오버레이만
+            return render_mod.draw_cached_modal(screen, None, None, None)
+
+        panel_w = int(w * 0.75)
+        panel_h = int(h * 0.75)
+        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
+        panel_rect.center = (w // 2, h // 2)
+
+        # 페이지가 바뀔 때만 패널을 다시 굽는다
+        key = ("tutorial", self.tutorial_index, len(self.tutorial_pages), self.font)
+        return render_mod.draw_cached_modal(screen, key, panel_rect, self.build_tutorial_panel)
+
 
     # ----- 이벤트 -----
     def handle_event(self, e):
@@ -1087,15 +1306,25 @@ class GameplayScene(Scene):
                 return
             self.pause_active = not self.pause_active
             return
-        
+
+        # 되돌리기 / 다시하기 (Ctrl+Z / Ctrl+Y, Ctrl+Shift+Z)
+        if e.type == pygame.KEYDOWN and (e.mod & pygame.KMOD_CTRL):
+            if not self.modal_active and not self.pause_active:
+                if e.key == pygame.K_z and not (e.mod & pygame.KMOD_SHIFT):
+                    self.undo_move()
+                    return
+                if e.key == pygame.K_y or e.key == pygame.K_z:
+                    self.redo_move()
+                    return
+
         if not self.modal_active and not self.pause_active:
+            # 카메라 조작 (확대/축소, 이동)
+            if self.handle_camera_event(e):
+                return
             self.menu_button.handle_event(e)
 
         # ----- 마우스 클릭 처리 -----
         if e.type == pygame.MOUSEBUTTONDOWN:
-            w, h = self.game.WIDTH, self.game.HEIGHT
-            cx, cy = w // 2, h // 2
-
             # 1) 클리어 모달 버튼
             if self.modal_active and e.button == 1 and self.modal_btn_rects:
                 mx, my = e.pos
@@ -1150,24 +1379,21 @@ class GameplayScene(Scene):
 
             # 3) 테두리 숫자 클릭 처리
             if not self.modal_active and not self.pause_active:
-                idx = render_mod.edge_hint_hit_test(
-                    self.board, (cx, cy), self.hex_size, e.pos
-                )
+                idx = self.edge_hint_at(e.pos)
                 if idx is not None:
                     ent = self.board.edge_hints[idx]
                     if e.button == 1:
-                        ent["helper_on"] = not ent.get("helper_on", False)
+                        self.board.set_edge_hint_flag(idx, "helper_on", not ent.get("helper_on", False))
                     elif e.button == 3:
-                        ent["dimmed"] = not ent.get("dimmed", False)
-                        ent["helper_on"] = False
+                        self.board.set_edge_hint_flag(idx, "dimmed", not ent.get("dimmed", False))
+                        self.board.set_edge_hint_flag(idx, "helper_on", False)
                     return  # 숫자를 눌렀으면 보드에는 클릭 전달 안 함
 
             # 4) 보드 타일 클릭 처리
             if not self.modal_active and not self.pause_active:
-                mx, my = pygame.mouse.get_pos()
-                lx, ly = mx - cx, my - cy
-                q, r = pixel_to_axial(lx, ly, self.hex_size)
-                if (q, r) in self.board.tiles:
+                pos = self.tile_at(e.pos)
+                if pos is not None:
+                    q, r = pos
                     # 사운드 판별을 위해 이전 상태 저장
                     old_mistakes = self.board.mistakes
                     old_revealed = getattr(self.board, "revealed_count", 0)
@@ -1194,7 +1420,7 @@ class GameplayScene(Scene):
                                 TileShakeAnim(
                                     q, r,
                                     duration=self.mistake_anim_duration,
-                                    amplitude=self.mistake_anim_amplitude,
+                                    amplitude=self.camera.size * self.mistake_anim_amplitude_ratio,
                                 )
                             )
 
@@ -1227,13 +1453,8 @@ class GameplayScene(Scene):
                 self.hover_tile = None
                 return
 
-            w, h = self.game.WIDTH, self.game.HEIGHT
-            cx, cy = w // 2, h // 2
-            mx, my = e.pos
-            lx, ly = mx - cx, my - cy
-
-            q, r = pixel_to_axial(lx, ly, self.hex_size)
-            t = self.board.tiles.get((q, r))
+            pos = self.tile_at(e.pos)
+            t = self.board.tiles.get(pos) if pos is not None else None
 
             # 보드 밖이거나, BLOCKED / REVEALED 타일이면 호버 없음
             if t is None or t.state in (C_BLOCKED, C_REVEALED):
@@ -1244,9 +1465,9 @@ class GameplayScene(Scene):
 
             # 여기서부터는 "reveal되지 않은 타일" (C_COVERED, C_FLAGGED 등)
             # → 타일 밖으로 나갔다가 다시 들어올 때마다 새로 애니/사운드
-            if self.hover_tile != (q, r):
-                self.hover_tile = (q, r)
-                self.hover_anim = TileHoverAnim(q, r)
+            if self.hover_tile != pos:
+                self.hover_tile = pos
+                self.hover_anim = TileHoverAnim(*pos)
 
                 if hasattr(self.game, "play_tile_hover"):
                     self.game.play_tile_hover()
@@ -1286,28 +1507,27 @@ class GameplayScene(Scene):
 
 
     def draw(self, screen):
-        # 배경 그리기
-        size = screen.get_size()
+        # 배경 그리기 (크기 변경은 BackgroundService가 버스로 받아서 맞춤)
         if hasattr(self, "bg"):
-            if self.bg.size != size:
-                self.bg.resize(size)
             self.bg.draw(screen)
         else:
             screen.fill((0, 0, 0))
 
-        # 현재 화면 크기 기준 중앙 좌표
+        # 현재 화면 크기 + 카메라 기준 보드 중심 / hex 크기
         w, h = screen.get_size()
-        center = (w // 2, h // 2)
+        center = self.camera.center((w, h))
+        size = self.camera.size
 
-        render_mod.draw_board(screen, self.board, center, self.hex_size, self.font)
-        render_mod.draw_edge_hints(screen, self.board, center, self.hex_size, self.font)
-        render_mod.draw_topright_info(screen, self.board, self.font)
+        render_mod.draw_board(screen, self.board, center, size, self.font)
+        render_mod.draw_edge_hints(screen, self.board, center, size, self.font)
+        # HUD가 차지한 영역 (부분 갱신용 damage rect)
+        self.hud_rect = render_mod.draw_topright_info(screen, self.board, self.font)
 
         if self.hover_anim is not None and self.hover_tile is not None:
-            draw_hover_anim(screen, self.hover_anim, center, self.hex_size)
+            draw_hover_anim(screen, self.hover_anim, center, size)
 
-        draw_reveal_anims(screen, self.reveal_anims, center, self.hex_size)
-        draw_shake_anims(screen, self.mistake_anims, center, self.hex_size)
+        draw_reveal_anims(screen, self.reveal_anims, center, size)
+        draw_shake_anims(screen, self.mistake_anims, center, size)
 
         self.menu_button.draw(screen)
 
@@ -0,0 +1,138 @@
+# core/surfaces.py
+from collections import OrderedDict
+import pygame
+
+
+class SurfacePool:
+    """
+    프레임 단위 임시 Surface 풀 + 디스플레이 포맷 Surface 팩토리.
+
+    - new_surface(): 오래 들고 있을 Surface(스프라이트 캐시 등)를 만든다.
+      디스플레이가 있으면 convert / convert_alpha까지 해서 돌려준다.
+    - scratch(): 이번 프레임에만 쓸 임시 Surface를 (크기, 알파)별 풀에서 꺼내 준다.
+      end_frame()에서 전부 회수되므로 프레임을 넘겨서 들고 있으면 안 된다.
+
+    프레임 통계 (직전 end_frame 기준):
+      last_allocs   : 새로 만든 Surface 수 (new_surface + 풀 미스)
+      last_acquires : scratch() 호출 수
+    """
+
+    # 이 프레임 수 동안 안 쓰인 크기의 여분 Surface는 버린다
+    IDLE_FRAMES = 120
+
+    def __init__(self):
+        self._free = {}        # key -> [Surface, ...]
+        self._used = []        # (key, Surface)
+        self._last_used = {}   # key -> frame 번호
+        self.frame = 0
+
+        self.frame_allocs = 0
+        self.frame_acquires = 0
+        self.last_allocs = 0
+        self.last_acquires = 0
+        self.total_allocs = 0
+
+    def new_surface(self, size, alpha=True):
+        w, h = size
+        size = (max(1, int(w)), max(1, int(h)))
+        if alpha:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surf = pygame.Surface(size)
+
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha() if alpha else surf.convert()
+
+        self.frame_allocs += 1
+        self.total_allocs += 1
+        return surf
+
+    def scratch(self, size, alpha=True, clear=True):
+        w, h = size
+        key = (max(1, int(w)), max(1, int(h)), bool(alpha))
+        self.frame_acquires += 1
+        self._last_used[key] = self.frame
+
+        free = self._free.get(key)
+        if free:
+            surf = free.pop()
+            if clear:
+                surf.fill((0, 0, 0, 0) if alpha else (0, 0, 0))
+        else:
+            surf = self.new_surface(key[:2], alpha)
+
+        self._used.append((key, surf))
+        return surf
+
+    def end_frame(self):
+        """이번 프레임에 빌려준 Surface를 회수하고 통계를 넘긴다."""
+        for key, surf in self._used:
+            self._free.setdefault(key, []).append(surf)
+        self._used.clear()
+
+        # 한동안 안 쓰인 크기는 정리 (크기가 매 프레임 조금씩 바뀌는 오버레이 대비)
+        limit = self.frame - self.IDLE_FRAMES
+        for key in [k for k, f in self._last_used.items() if f < limit]:
+            del self._last_used[key]
+            self._free.pop(key, None)
+
+        self.last_allocs = self.frame_allocs
+        self.last_acquires = self.frame_acquires
+        self.frame_allocs = 0
+        self.frame_acquires = 0
+        self.frame += 1
+
+
+class BoundedCache:
+    """
+    개수 제한이 있는 LRU 캐시. 모듈마다 들고 있는 스프라이트 / 레이아웃 캐시가 같이 쓴다.
+
+    - get(): 찾으면 가장 최근에 쓴 것으로 올린다.
+    - cache[key] = value: 꽉 차 있으면 가장 오래 안 쓴 것부터 버린다.
+    """
+
+    __slots__ = ("maxsize", "_data")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        data = self._data
+        value = data.get(key, default)
+        if value is not default:
+            data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        elif len(data) >= self.maxsize:
+            data.popitem(last=False)
+        data[key] = value
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+
+
+# 모든 모듈이 공유하는 기본 풀
+pool = SurfacePool()
+
+
+def new_surface(size, alpha=True):
+    return pool.new_surface(size, alpha)
+
+
+def scratch(size, alpha=True, clear=True):
+    return pool.scratch(size, alpha, clear)
+
+
+def end_frame():
+    pool.end_frame()
@@ -1,9 +1,14 @@
 # core/ui.py
 import pygame
+from core import surfaces
 
 play_ui_click = None
 
 class Button:
+    # 드롭 섀도우 오프셋 (스프라이트 높이에 포함)
+    SHADOW_OFFSET = 3
+    CORNER_RADIUS = 14
+
     def __init__(self, rect, text, font, on_click, bg=(40, 46, 60), fg=(234, 242, 255)):
         self.rect = pygame.Rect(rect)
         self.text = text
@@ -13,6 +18,11 @@ class Button:
         self.fg = fg
         self.hover = False
 
+        # (text, bg, fg, font, 크기) → {hover: 스프라이트}
+        # 씬에서 매 프레임 bg 등을 다시 대입해도 값이 같으면 재사용된다.
+        self._sprite_key = None
+        self._sprites = {}
+
     def handle_event(self, e):
         if e.type == pygame.MOUSEMOTION:
             self.hover = self.rect.collidepoint(e.pos)
@@ -25,24 +35,27 @@ class Button:
                 if self.on_click:
                     self.on_click()
 
-    def draw(self, surf):
+    def _render_sprite(self, hover):
+        """섀도우 + 본체 + 하이라이트 + 텍스트를 한 장의 SRCALPHA 스프라이트로 굽는다."""
+        w, h = self.rect.size
+        corner_radius = self.CORNER_RADIUS
+        sprite = surfaces.new_surface((w, h + self.SHADOW_OFFSET))
+
         # 1) 드롭 섀도우
-        shadow_offset = 3
-        shadow_rect = self.rect.move(0, shadow_offset)
         pygame.draw.rect(
-            surf,
+            sprite,
             (5, 8, 16),      # 아주 어두운 남색 계열 그림자
-            shadow_rect,
-            border_radius=14
+            pygame.Rect(0, self.SHADOW_OFFSET, w, h),
+            border_radius=corner_radius
         )
 
         # 2) 버튼 본체를 별도 Surface에 그림
-        btn_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        btn_surf = surfaces.scratch((w, h))
         btn_rect = btn_surf.get_rect()
 
         # 기본 배경색 + hover 시 살짝 밝게
         bg = self.bg
-        if self.hover:
+        if hover:
             lighten = 18
             r = min(bg[0] + lighten, 255)
             g = min(bg[1] + lighten, 255)
@@ -50,7 +63,6 @@ class Button:
             bg = (r, g, b)
 
         # 2-1) 기본 바탕 (둥근 사각형)
-        corner_radius = 14
         pygame.draw.rect(btn_surf, bg, btn_rect, border_radius=corner_radius)
 
         # 2-2) 테두리 (은은한 라인)
@@ -62,8 +74,7 @@ class Button:
         pygame.draw.rect(btn_surf, border_color, btn_rect, width=2, border_radius=corner_radius)
 
         # 2-3) 위쪽에만 살짝 하이라이트 그라디언트 (모서리 안쪽으로만)
-        grad = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        h = self.rect.height
+        grad = surfaces.scratch((w, h))
         for y in range(h // 2):
             t = y / max(1, (h // 2) - 1)
             alpha = int(60 * (1.0 - t))  # 위쪽이 더 밝음
@@ -73,7 +84,7 @@ class Button:
                 grad,
                 (255, 255, 255, alpha),
                 (corner_radius, y),
-                (self.rect.width - corner_radius, y),
+                (w - corner_radius, y),
             )
         btn_surf.blit(grad, (0, 0))
 
@@ -81,8 +92,27 @@ class Button:
         label = self.font.render(self.text, True, self.fg)
         btn_surf.blit(label, label.get_rect(center=btn_rect.center))
 
-        # 4) 최종 blit
-        surf.blit(btn_surf, self.rect.topleft)
+        sprite.blit(btn_surf, (0, 0))
+        return sprite
+
+    def bounds(self):
+        """draw()가 실제로 칠하는 영역 (섀도우 포함)."""
+        return pygame.Rect(self.rect.x, self.rect.y,
+                           self.rect.width, self.rect.height + self.SHADOW_OFFSET)
+
+    def draw(self, surf):
+        key = (self.text, tuple(self.bg), tuple(self.fg), self.font, self.rect.size)
+        if key != self._sprite_key:
+            self._sprite_key = key
+            self._sprites = {}
+
+        sprite = self._sprites.get(self.hover)
+        if sprite is None:
+            sprite = self._render_sprite(self.hover)
+            self._sprites[self.hover] = sprite
+
+        # 캐시된 상태 스프라이트 한 장만 blit
+        surf.blit(sprite, self.rect.topleft)
 
 class Slider:
     def __init__(self, rect, min_val, max_val, value, on_change=None,
@@ -121,6 +151,10 @@ class Slider:
             if self.on_change:
                 self.on_change(self.value)
 
+    def bounds(self):
+        """draw()가 실제로 칠하는 영역 (양 끝 노브 반지름 포함)."""
+        return self.rect.inflate(18, 0)
+
     def draw(self, surf):
         y = self.rect.centery
         # 트랙
@@ -133,6 +167,156 @@ class Slider:
         # 노브
         pygame.draw.circle(surf, self.knob_color, (knob_x, y), 8)
 
+class WidgetGroup:
+    """
+    Button / Slider 같은 위젯 묶음.
+
+    - 포인터 이벤트는 격자(CELL px) 인덱스로 커서 아래 위젯만 찾아서 넘긴다.
+      (드래그 중인 위젯은 버튼을 뗄 때까지 이벤트를 계속 받는다)
+    - 이벤트를 받았거나 mark_dirty()된 위젯은 dirty로 표시되고,
+      draw()가 그 영역 목록(damage rect)을 돌려준다.
+      draw(full=False, background=...)는 그 영역만 배경을 복구하고 다시 그린다.
+    - set_layout()으로 화면 크기 → 위젯 rect 배치 함수를 등록하면
+      크기별 결과를 캐시해 두고 relayout(size)에서 재사용한다.
+    """
+
+    CELL = 64
+    LAYOUT_CACHE_SIZE = 4
+
+    def __init__(self, widgets=()):
+        self.widgets = []
+        self._grid = {}
+        self._dirty = set()
+        self.hovered = None
+        self.capture = None
+
+        self._layout_fn = None
+        self._layouts = surfaces.BoundedCache(self.LAYOUT_CACHE_SIZE)
+        self.size = None
+
+        for w in widgets:
+            self.add(w)
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        self._dirty.add(widget)
+        self.rebuild_index()
+        return widget
+
+    # ----- 배치 -----
+    def set_layout(self, fn):
+        """fn(size) -> 위젯 순서대로의 (x, y, w, h) 리스트"""
+        self._layout_fn = fn
+        self._layouts.clear()
+        self.size = None
+
+    def relayout(self, size):
+        size = tuple(size)
+        if self._layout_fn is None or size == self.size:
+            return
+        rects = self._layouts.get(size)
+        if rects is None:
+            rects = [tuple(r) for r in self._layout_fn(size)]
+            self._layouts[size] = rects
+
+        self.size = size
+        for w, r in zip(self.widgets, rects):
+            w.rect.update(r)
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """위젯 rect가 바뀌었으면 호출 (add / relayout은 자동으로 부른다)."""
+        cell = self.CELL
+        grid = {}
+        for w in self.widgets:
+            r = w.rect
+            for gy in range(r.top // cell, (r.bottom - 1) // cell + 1):
+                for gx in range(r.left // cell, (r.right - 1) // cell + 1):
+                    grid.setdefault((gx, gy), []).append(w)
+        self._grid = grid
+        self._dirty.update(self.widgets)
+
+    def widget_at(self, pos):
+        x, y = pos
+        bucket = self._grid.get((int(x) // self.CELL, int(y) // self.CELL))
+        if bucket:
+            # 나중에 추가된 위젯이 위에 그려지므로 뒤에서부터
+            for w in reversed(bucket):
+                if w.rect.collidepoint(x, y):
+                    return w
+        return None
+
+    # ----- 이벤트 -----
+    def _send(self, widget, e):
+        widget.handle_event(e)
+        self._dirty.add(widget)
+
+    def handle_event(self, e):
+        """포인터 이벤트를 해당 위젯에만 전달. 처리한 위젯이 있으면 True."""
+        if e.type == pygame.MOUSEMOTION:
+            under = self.widget_at(e.pos)
+            targets = []
+            for w in (self.capture, self.hovered, under):
+                if w is not None and w not in targets:
+                    targets.append(w)
+            self.hovered = under
+            for w in targets:
+                self._send(w, e)
+            return bool(targets)
+
+        if e.type == pygame.MOUSEBUTTONDOWN:
+            under = self.widget_at(e.pos)
+            if under is None:
+                return False
+            if e.button == 1:
+                self.capture = under
+            self._send(under, e)
+            return True
+
+        if e.type == pygame.MOUSEBUTTONUP:
+            targets = []
+            for w in (self.capture, self.widget_at(e.pos)):
+                if w is not None and w not in targets:
+                    targets.append(w)
+            if e.button == 1:
+                self.capture = None
+            for w in targets:
+                self._send(w, e)
+            return bool(targets)
+
+        return False
+
+    # ----- 그리기 -----
+    def mark_dirty(self, widget=None):
+        if widget is None:
+            self._dirty.update(self.widgets)
+        else:
+            self._dirty.add(widget)
+
+    def draw(self, surf, full=True, background=None):
+        """
+        full=True  : 배경을 매 프레임 다시 칠하는 씬용. 전부 그린다.
+        full=False : 화면을 유지하는 경우 dirty 위젯 영역만 다시 그린다.
+                     background(surf와 같은 크기의 Surface)를 주면 그 영역을 먼저
+                     배경으로 덮고, 영역과 겹치는 위젯을 순서대로 다시 그린다.
+        어느 쪽이든 이번에 바뀐 영역 리스트를 돌려주고 dirty를 비운다.
+        """
+        damage = [w.bounds() for w in self.widgets if w in self._dirty]
+        self._dirty.clear()
+        if full:
+            for w in self.widgets:
+                w.draw(surf)
+            return damage
+
+        if background is not None:
+            for r in damage:
+                surf.blit(background, r, r)
+        for w in self.widgets:
+            if w.bounds().collidelist(damage) != -1:
+                w.draw(surf)
+        return damage
+
+
 def draw_label_center(surf, text, font, center, color=(234,242,255)):
     img = font.render(text, True, color)
     surf.blit(img, img.get_rect(center=center))
\ No newline at end of file
@@ -40,4 +40,13 @@ RESOLUTIONS = [
     (1280, 720),
     (1600, 900),
 ]
-DEFAULT_RES_INDEX = 0
\ No newline at end of file
+DEFAULT_RES_INDEX = 0
+
+# 논리 해상도 렌더링 (선택)
+# True면 씬은 항상 App.WIDTH / HEIGHT 크기의 오프스크린에 그리고,
+# (= 해상도 옵션에서 고른 RESOLUTIONS 항목. 시작 시에는 DEFAULT_RES_INDEX)
+# 실제 창/전체 화면 크기에 맞춰 한 번에 스케일해서 내보낸다.
+# → 표시 모드를 바꿔도 레이아웃 / 스프라이트 캐시가 그대로 유효.
+LOGICAL_RENDER = False
+# 스케일 방식: False = 최근접(빠름), True = smoothscale(부드럽지만 느림)
+LOGICAL_SMOOTH_SCALE = False
\ No newline at end of file
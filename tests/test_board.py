@@ -0,0 +1,161 @@
+# tests/test_board.py
+import json
+import os
+
+from core.board import Board, C_COVERED
+from core.grid import HexGrid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_board(relpath):
+    with open(os.path.join(ROOT, relpath), "r", encoding="utf-8") as f:
+        st = json.load(f)
+    return Board(HexGrid.from_stage(st), st)
+
+
+def snapshot(board):
+    return (
+        {pos: t.state for pos, t in board.tiles.items()},
+        board.flag_count,
+        board.revealed_count,
+        board.mines_left,
+        board.mistakes,
+        set(board.locked_flags),
+        board.is_win,
+        board.is_game_over,
+    )
+
+
+def covered_cells(board):
+    """(지뢰 칸, 안전 칸) — 아직 덮여 있는 칸만, 좌표 순."""
+    mines, safe = [], []
+    for pos, t in sorted(board.tiles.items()):
+        if t.state == C_COVERED:
+            (mines if t.is_mine else safe).append(pos)
+    return mines, safe
+
+
+def solve(board):
+    """안전 칸을 모두 열고 지뢰에 모두 깃발을 꽂는다 (칸마다 저널 엔트리 1개 이하)."""
+    mines, safe = covered_cells(board)
+    for pos in safe:
+        if board.tiles[pos].state == C_COVERED:
+            board.reveal(*pos)
+    for pos in mines:
+        board.toggle_flag(*pos)
+
+
+def test_clone_edge_hint_flags_independent():
+    # 공유를 끊은 뒤 다른 인덱스를 바꿔도 클론에는 반영되지 않아야 한다
+    board = load_board("stages/advance/032.json")
+    assert len(board.edge_hints) >= 2
+    clone = board.clone()
+
+    board.set_edge_hint_flag(0, "dimmed", True)
+    board.set_edge_hint_flag(1, "helper_on", True)
+
+    assert not clone.edge_hints[0].get("dimmed", False)
+    assert not clone.edge_hints[1].get("helper_on", False)
+
+    # 반대 방향(클론 쪽 수정)도 원본에 새지 않아야 한다
+    clone.set_edge_hint_flag(1, "dimmed", True)
+    assert not board.edge_hints[1].get("dimmed", False)
+
+
+
+def test_journal_round_trip():
+    # dump_journal → JSON → 새 보드 load_journal 결과가 원래 보드와 같아야 한다
+    board = load_board("stages/advance/032.json")
+    mines, safe = covered_cells(board)
+    assert len(mines) >= 2 and safe
+
+    board.reveal(*mines[0])         # 지뢰 클릭: 실수 +1
+    board.toggle_flag(*safe[-1])    # 안전 칸 깃발: 실수 +1
+    solve(board)
+    assert board.is_win
+    board.undo()                    # 커서가 끝이 아닌 상태도 저장되어야 한다
+
+    data = json.loads(json.dumps(board.dump_journal()))
+    fresh = load_board("stages/advance/032.json")
+    fresh.load_journal(data)
+
+    assert snapshot(fresh) == snapshot(board)
+    assert fresh.mistakes == 2
+    assert fresh.journal_pos == board.journal_pos
+    assert fresh.can_redo()
+
+    board.redo()
+    fresh.redo()
+    assert snapshot(fresh) == snapshot(board)
+    assert fresh.is_win
+
+
+def test_undo_redo_restores_state():
+    board = load_board("stages/advance/032.json")
+    mines, safe = covered_cells(board)
+    # 엣지 힌트 표시는 플레이어 메모라 저널 대상이 아니다 → undo/redo 후에도 유지
+    board.set_edge_hint_flag(0, "dimmed", True)
+    start = snapshot(board)
+
+    board.toggle_flag(*mines[0])    # 지뢰 깃발 → 잠금
+    board.reveal(*mines[1])         # 실수 +1
+    board.reveal(*safe[0])
+    assert mines[0] in board.locked_flags
+    moved = snapshot(board)
+
+    while board.can_undo():
+        board.undo()
+    assert snapshot(board) == start
+    assert mines[0] not in board.locked_flags
+    assert board.edge_hints[0]["dimmed"]
+
+    while board.can_redo():
+        board.redo()
+    assert snapshot(board) == moved
+    assert board.edge_hints[0]["dimmed"]
+
+    # 되돌린 뒤 새 조작을 하면 redo 꼬리는 버려진다
+    board.undo()
+    board.undo()
+    assert board.can_redo()
+    board.toggle_flag(*mines[1])
+    assert not board.can_redo()
+    assert board.journal_pos == len(board.journal) == 2
+
+
+def test_clone_undo_does_not_touch_original():
+    board = load_board("stages/advance/032.json")
+    mines, safe = covered_cells(board)
+    board.toggle_flag(*mines[0])
+    before = snapshot(board)
+
+    clone = board.clone()
+    clone.reveal(*safe[0])
+    clone.toggle_flag(*mines[1])
+    clone.undo()
+    clone.undo()
+
+    assert snapshot(board) == before
+    assert snapshot(clone) == before
+
+
+
+def test_clone_chain_independent():
+    # 클론의 클론을 여러 세대 만들어도 (층 합치기 포함) 서로의 쓰기가 새지 않아야 한다
+    board = load_board("stages/advance/032.json")
+    mines, safe = covered_cells(board)
+    boards = [board]
+    expected = [snapshot(board)[0]]
+    for i in range(12):
+        parent = boards[-1]
+        clone = parent.clone()
+        parent.reveal(*safe[i])             # 클론 이후 부모 쓰기
+        clone.toggle_flag(*mines[i % len(mines)])
+        expected[-1] = snapshot(parent)[0]
+        boards.append(clone)
+        expected.append(snapshot(clone)[0])
+
+    for b, states in zip(boards, expected):
+        assert snapshot(b)[0] == states
+    assert all(boards[0].tiles[pos].state == C_COVERED for pos in mines)